@@ -1,618 +1,2244 @@
-from abc import ABC, abstractmethod
-import subprocess
-import os
-from typing import List, Literal, Tuple
-import argparse
-from dataclasses import dataclass
-
-USER_OUTPUT_FILENAME = "output.user.out"
-TC_DIR = "test_cases"
-
-
-class CustomException(Exception):
-    """Represent a custom exception"""
-
-    def __init__(self, msg: str):
-        super().__init__(msg)
-        self.msg = msg
-
-
-@dataclass
-class ArgumentConfig():
-    '''
-    Object used to store config from CLI arguments
-    '''
-    # Initialize default configuration
-    filename: str = None
-    test_cases: str = None
-    input_strat: str = "automatic"
-    check_strat: str = "line"
-    checker_name: str = "checker.py"
-    input_filename = "input.in"
-    output_filename = "input.ans"
-
-
-class SubmissionFileNotFound(CustomException):
-    """Exception to be raise when submission file is not found"""
-
-    def __init__(self, submission_filename: str):
-        super().__init__(f"Submission file {submission_filename} not found")
-
-
-class TCNotFound(CustomException):
-    """Exception to be raise when test case is not found in current directory"""
-
-    def __init__(self, tc_dirname: str):
-        super().__init__(f"Test case not found in directory {tc_dirname}")
-
-
-class InvalidSubmissionFile(CustomException):
-    """Exception to be raise when invalid submission file is found"""
-
-
-class InvalidStrategy(CustomException):
-    """Exception to be raised when invalid strategy is found"""
-
-
-class CheckerNotFound(CustomException):
-    """Exception to be raised when checker file is not found"""
-
-    def __init__(self):
-        super().__init__("Checker file not found")
-
-
-class CompilingStrategy(ABC):
-    '''
-
-    Represent a generic Compiling Strategy
-
-    Constructor requires 2 parameters:
-        filename(str): name of source code file WITHOUT extension
-        filename_with_ext(str): name of source code file WITH extension
-
-    '''
-
-    def __init__(self, filename: str, filename_with_ext: str):
-        self.filename_without_extension = filename
-        self.filename_with_extension = filename_with_ext
-
-    @abstractmethod
-    def get_compile_command(self) -> str:
-        """Returns compile command for source code file"""
-
-    @abstractmethod
-    def get_execute_command(self) -> str:
-        """Returns execute command for source code file"""
-
-    @abstractmethod
-    def cleanup(self):
-        """Clean up files after running submission"""
-
-
-class CppCompilingStrategy(CompilingStrategy):
-    """C++ Compiling Strategy (refer to CompilingStrategy class on how to initialize)"""
-
-    def get_compile_command(self) -> str:
-        return f' \
-        g++ -std=c++17 -Wshadow -Wall -o \
-            "{self.filename_without_extension}" \
-                "{self.filename_with_extension}" \
-                    -O2 -Wno-unused-result'
-
-    def get_execute_command(self) -> str:
-        return f'{self.filename_without_extension}.exe'
-
-    def cleanup(self):
-        for file in os.listdir(os.path.join(os.getcwd())):
-            if file[-3:] == "exe":
-                os.remove(os.path.join(os.getcwd(), file))
-
-
-class JavaCompilingStrategy(CompilingStrategy):
-    """Java Compiling Strategy (refer to CompilingStrategy class on how to initialize)"""
-
-    def get_compile_command(self) -> str:
-        return f'javac {self.filename_with_extension}'
-
-    def get_execute_command(self) -> str:
-        return f'java {self.filename_without_extension}'
-
-    def cleanup(self):
-        for file in os.listdir(os.path.join(os.getcwd())):
-            if file[-5:] == "class":
-                os.remove(os.path.join(os.getcwd(), file))
-
-
-class InputStrategy(ABC):
-    """Represent a generic Input strategy"""
-
-    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
-        '''
-
-        Generic initialization of an input strategy
-        Generate path of input and user output file and check if input file exists
-
-        '''
-        self.parsed_args = parsed_args
-        self.input_filepath = os.path.join(tc_dir, parsed_args.input_filename)
-        self.user_output_filepath = os.path.join(tc_dir, USER_OUTPUT_FILENAME)
-
-        if not os.path.isfile(self.input_filepath):
-            raise TCNotFound(os.path.basename(os.path.normpath(tc_dir)))
-
-    @abstractmethod
-    def execute_strategy(self, execute_command: str):
-        '''
-        Run the provided command inside the environment of an input strategy
-
-        Parameters:
-        execute_command(str): command to be executed
-
-        '''
-
-
-class AutomaticInputStrategy(InputStrategy):
-    '''
-
-    Automatic Input strategy
-    Use case: When source code is expected to read data from stdin
-
-    '''
-
-    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
-        super().__init__(parsed_args, tc_dir)
-        self.input_fileobj = open(self.input_filepath, encoding='utf-8')
-        self.user_output_fileobj = open(
-            self.user_output_filepath, 'w', encoding='utf-8')
-
-    def __cleanup(self):
-        """Do necessary clean-up after executing the strategy"""
-        self.input_fileobj.close()
-        self.user_output_fileobj.close()
-
-    def execute_strategy(self, execute_command: str):
-        p = subprocess.Popen(execute_command, stdin=self.input_fileobj,
-                             stdout=self.user_output_fileobj, shell=True, cwd=os.getcwd())
-        p.wait()
-        self.user_output_fileobj.flush()
-        self.__cleanup()
-
-
-class ManualInputStrategy(InputStrategy):
-    '''
-
-    Manual Input Strategy
-    Use case: When source code is expected to read data directly from text file
-
-    '''
-
-    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
-        super().__init__(parsed_args, tc_dir)
-        self.temporary_input_filepath = os.path.join(
-            os.getcwd(), parsed_args.input_filename)
-        self.temporary_user_output_filepath = os.path.join(
-            os.getcwd(), USER_OUTPUT_FILENAME)
-
-        os.rename(self.input_filepath, self.temporary_input_filepath)
-        self.user_output_fileobj = open(
-            self.temporary_user_output_filepath, 'w', encoding='utf-8')
-
-    def __cleanup(self):
-        """Do necessary clean-up after executing the strategy"""
-        self.user_output_fileobj.close()
-        os.rename(self.temporary_input_filepath, self.input_filepath)
-        os.rename(self.temporary_user_output_filepath,
-                  self.user_output_filepath)
-
-    def execute_strategy(self, execute_command: str):
-        execute_process = subprocess.Popen(
-            execute_command, stdout=self.user_output_fileobj, shell=True, cwd=os.getcwd())
-        execute_process.wait()
-        self.user_output_fileobj.flush()
-        self.__cleanup()
-
-
-class CheckSolutionStrategy(ABC):
-    """Represent a strategy used for verifying output produced by source code"""
-
-    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
-        self.parsed_args = parsed_args
-        self.user_output_filepath = os.path.join(tc_dir, USER_OUTPUT_FILENAME)
-        self.expected_output_filepath = os.path.join(
-            tc_dir, parsed_args.output_filename)
-
-        if not os.path.isfile(self.expected_output_filepath):
-            raise TCNotFound(os.path.basename(os.path.normpath(tc_dir)))
-
-        self.user_output_fileobj = None
-        self.expected_output_fileobj = None
-
-    def setup_strategy(self):
-        """Setup steps needs to be done before verifying solution"""
-        self.user_output_fileobj = open(
-            self.user_output_filepath, 'r', encoding='utf-8')
-        self.expected_output_fileobj = open(
-            self.expected_output_filepath, 'r', encoding='utf-8')
-
-    @abstractmethod
-    def check_output(self) -> Literal['AC', 'WA']:
-        '''
-
-        Determines whether solution is correct
-
-        Returns "AC" if solution is correct, "WA" otherwise
-
-        '''
-
-    def cleanup(self):
-        """Clean up stuffs after checking solution"""
-        self.user_output_fileobj.close()
-        self.expected_output_fileobj.close()
-        os.remove(self.user_output_filepath)
-
-
-class LineCompareCheckStrategy(CheckSolutionStrategy):
-    """
-    A strategy of verifying solution by checking user output against expected output line by line
-    """
-
-    def check_output(self):
-        self.setup_strategy()
-        verdict = "AC"
-        for line in self.expected_output_fileobj:
-            user_line = self.user_output_fileobj.readline().rstrip('\r\n')
-            expected_line = line.rstrip('\r\n')
-
-            if user_line != expected_line:
-                verdict = "WA"
-                break
-
-        self.cleanup()
-        return verdict
-
-
-class CheckerCompareCheckStrategy(CheckSolutionStrategy):
-    """A strategy of verifying solution using a checker"""
-
-    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
-        super().__init__(parsed_args, tc_dir)
-        self.input_filepath = os.path.join(tc_dir, parsed_args.input_filename)
-
-    def setup_strategy(self):
-        checker_filepath = os.path.join(
-            os.getcwd(), self.parsed_args.checker_name)
-        if not os.path.isfile(checker_filepath):
-            raise CheckerNotFound()
-
-    @staticmethod
-    def evaluate_python_compiler() -> Literal['python', 'python3']:
-        '''Determine the appropriate python compiler based on operating system'''
-        return 'python' if (sys.platform == 'win32') else 'python3'
-
-    def run_checker(self) -> int:
-        '''
-        Run checker with provided input file and output files
-
-        Returns exit code of checker
-        '''
-        checker_process = subprocess.Popen([
-            CheckerCompareCheckStrategy.evaluate_python_compiler(),
-            '-u',
-            self.parsed_args.checker_name,
-            self.input_filepath,
-            self.user_output_filepath,
-            self.expected_output_filepath
-        ], cwd=os.getcwd())
-
-        return checker_process.wait()
-
-    def check_output(self):
-        checker_exit_code = self.run_checker()
-        verdict = 'AC' if (checker_exit_code == 0) else 'WA'
-        self.cleanup()
-        return verdict
-
-    def cleanup(self):
-        os.remove(self.user_output_filepath)
-
-
-def check_tc(
-    execute_command: str,
-    input_strategy: InputStrategy,
-    check_strategy: CheckSolutionStrategy
-):
-    '''
-    Run user's code against provided a test case
-
-    Parameters:
-    execute_command (str): Command used to execute file generated from
-    compilation of submission file
-    input_strategy (InputStrategy): Input strategy that is used for this source code
-    check_strategy (CheckSolutionStrategy): Strategy used by source code to verify correctness
-
-    '''
-    input_strategy.execute_strategy(execute_command)
-
-    # Get verdict by checking user output against expected output
-    tc_verdict = check_strategy.check_output()
-
-    return tc_verdict
-
-
-def compile_submission(compile_command: str):
-    """Compile user submission"""
-    subprocess.call(compile_command, shell=True, cwd=os.getcwd())
-
-
-def evaluate_submission(parsed_args: ArgumentConfig, compiling_strategy: CompilingStrategy):
-    '''
-    Evaluate provided submission file by running it against provided test cases
-
-    Parameters:
-    compiling_strategy (CompilingStrategy): Compiling strategy used by source code
-
-    '''
-    compile_command = compiling_strategy.get_compile_command()
-    execute_command = compiling_strategy.get_execute_command()
-
-    # Compile user submission
-    compile_submission(compile_command)
-
-    verdict_list = []
-
-    # Loop through each test case directory and get verdict of that test case
-    for directory in os.listdir(os.path.join(os.getcwd(), TC_DIR)):
-        tc_dir = os.path.join(os.getcwd(), TC_DIR, directory)
-        tc_verdict = check_tc(
-            execute_command,
-            get_input_strategy(parsed_args, tc_dir),
-            get_check_solution_strategy(parsed_args, tc_dir)
-        )
-        verdict_list.append((directory, tc_verdict))
-
-    # Print verdict of all test cases
-    print_verdict(verdict_list)
-
-    # Clean up
-    compiling_strategy.cleanup()
-
-
-def print_verdict(verdict_list: List[Tuple[str, str]]):
-    '''
-    Print test case verdict with appropriate format
-
-    Parameters:
-    verdict_list(list[str]): list of verdicts
-
-    '''
-    print()
-    for (directory, verdict) in verdict_list:
-        passed = verdict.rstrip('\r\n') == "AC"
-
-        if not passed:
-            msg = f" x Test case {directory} failed"
-            print(f"\033[91m{msg}\033[00m")
-        else:
-            msg = f"Test case {directory} passed"
-            print(f"\033[92m{msg}\033[00m")
-        sys.stdout.flush()
-    print()
-
-
-def get_compiling_strategy(filename_without_extension: str, extension: str) -> CompilingStrategy:
-    '''
-
-    Generate a compiling strategy based on extension of source code file
-
-    Parameters:
-    filename_without_extension: file name of the source code file without extension
-    extension: extension of the source code file
-
-    '''
-    instance_factory = {
-        '.cpp': CppCompilingStrategy,
-        '.java': JavaCompilingStrategy
-    }
-
-    if extension not in instance_factory:
-        raise InvalidSubmissionFile("Extension is not supported")
-
-    return instance_factory[extension](
-        filename_without_extension,
-        filename_without_extension + extension
-    )
-
-
-def get_input_strategy(parsed_args: ArgumentConfig, tc_dir: str) -> InputStrategy:
-    '''
-
-    Generate input strategy based on configuration
-
-    Parameters:
-    tc_dir(str): directory of current test case
-
-    '''
-    instance_factory = {
-        'automatic': AutomaticInputStrategy,
-        'manual': ManualInputStrategy
-    }
-
-    if parsed_args.input_strat not in instance_factory:
-        raise InvalidStrategy(
-            f'Input strategy {parsed_args.input_strat} not supported')
-
-    return instance_factory[parsed_args.input_strat](parsed_args, tc_dir)
-
-
-def get_check_solution_strategy(parsed_args: ArgumentConfig, tc_dir: str) -> CheckSolutionStrategy:
-    '''
-
-    Generate a strategy to verify solution
-
-    Parameters:
-    tc_dir(str): directory of current test case
-
-    '''
-    instance_factory = {
-        'line': LineCompareCheckStrategy,
-        'checker': CheckerCompareCheckStrategy
-    }
-
-    if parsed_args.check_strat not in instance_factory:
-        raise InvalidStrategy("Check Solution Strategy not found")
-
-    return instance_factory[parsed_args.check_strat](parsed_args, tc_dir)
-
-
-def check_valid_file(filename: str):
-    '''
-    Check if submission file is a valid file
-    If file is valid, return filename (without extension) and extension as tuple of strings
-
-    Parameters:
-    filename(str): filename with extension of user source code
-    '''
-    # Extract file extension
-    idx = filename.find('.')
-
-    # If there is no extension
-    if idx == -1:
-        raise InvalidSubmissionFile("Extension not included")
-
-    # If filename only contains extension
-    if idx == 0:
-        raise InvalidSubmissionFile("File name not found")
-
-    # Check if file exists
-    filepath = os.path.join(os.getcwd(), filename)
-    if not os.path.isfile(filepath):
-        raise SubmissionFileNotFound(filename)
-
-    return filename[:idx], filename[idx:]
-
-
-def cleanup_dir(dirname: str):
-    '''Clean up test_cases directory'''
-    for filename in os.listdir(dirname):
-        if os.path.isdir(f'{dirname}/{filename}'):
-            cleanup_dir(f'{dirname}/{filename}')
-            os.rmdir(dirname)
-        else:
-            os.unlink(f'{dirname}/{filename}')
-
-
-def import_test_cases(parsed_args: ArgumentConfig) -> None:
-    '''
-    Import external test cases.
-    Folder can only contains .in and .out files
-    '''
-    ext_tc_dir = parsed_args.test_cases
-
-    if not ext_tc_dir:
-        return
-
-    if not os.path.isdir(ext_tc_dir):
-        raise TCNotFound(ext_tc_dir)
-
-    cleanup_dir(TC_DIR)
-
-    tc_names = set(".".join(filename.split('.')[:-1])
-                   for filename in os.listdir(ext_tc_dir))
-
-    for tc_name in tc_names:
-        input_filename = f'{tc_name}.in'
-        output_filename = f'{tc_name}.ans'
-        os.mkdir(f'{TC_DIR}/{tc_name}')
-        os.rename(f'{ext_tc_dir}/{input_filename}',
-                  f'{TC_DIR}/{tc_name}/{parsed_args.input_filename}')
-        os.rename(f'{ext_tc_dir}/{output_filename}',
-                  f'{TC_DIR}/{tc_name}/{parsed_args.output_filename}')
-
-
-def parse_args():
-    '''
-    Parse CLI arguments
-
-    Parameters:
-        - args: argument list stored as string array
-
-    Returns:
-        ArgumentParser object containing parsed data
-    '''
-    arg_config = ArgumentConfig()
-
-    parser = argparse.ArgumentParser(
-        description="Mini Judge to test your solution against pre-generated test cases",
-    )
-
-    parser.add_argument(
-        '-f', '--filename', help="Name of solution file", action='store')
-    parser.add_argument('-tc', '--test_cases',
-                        help="Location of test case", action="store")
-    parser.add_argument(
-        '-is', '--input_strat', help="Input strategy (automatic | manual)", action='store'
-    )
-    parser.add_argument(
-        '-cs', '--check_strat', help="Check strategy (line | checker)", action='store'
-    )
-    parser.add_argument(
-        '-cn', '--checker_name', help="Name of checker file", action="store"
-    )
-    parser.add_argument(
-        '-in', '--input_filename', help="Input filename", action="store"
-    )
-    parser.add_argument(
-        '-out', '--output_filename', help="Expected output filename", action="store"
-    )
-
-    parser.parse_args(namespace=arg_config)
-
-    return arg_config
-
-
-def get_filename(parsed_args: ArgumentConfig):
-    '''
-    Determine submission filename.
-
-    If filename is not provided as CLI argument, it will be prompted.
-
-    Parameters:
-        - parsed_args: object containing parsed argument configurations
-    '''
-    if not parsed_args.filename:
-        print("Enter filename: ", end='')
-        input_file = input()
-        return input_file
-
-    return parsed_args.filename
-
-
-def main():
-    """Driver code"""
-
-    # Parse arguments
-    parsed_args = parse_args()
-
-    # Import external test cases
-    import_test_cases(parsed_args)
-
-    # Prompt for submission's filename
-    input_file = get_filename(parsed_args)
-
-    filename_without_extension, extension = check_valid_file(input_file)
-
-    # Generate compiling strategy for source code
-    compiling_strategy = get_compiling_strategy(
-        filename_without_extension, extension)
-
-    # Evaluate source code
-    evaluate_submission(parsed_args, compiling_strategy)
-
-
-if __name__ == '__main__':
-    import sys
-    try:
-        sys.exit(main())
-    except CustomException as err:
-        print(f"\033[91m{err.msg}\033[00m")
-        sys.exit(1)
+from abc import ABC, abstractmethod
+import subprocess
+import os
+import shlex
+import shutil
+import sys
+import tempfile
+import threading
+from typing import Dict, List, Literal, Tuple
+import argparse
+import ast
+import atexit
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import io
+import json
+import mmap
+import multiprocessing
+import py_compile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+USER_OUTPUT_FILENAME = "output.user.out"
+# Outputs smaller than this are cheap enough to diagnose line by line
+VECTORIZED_DIFF_THRESHOLD = 64 * 1024
+# Outputs larger than this are compared incrementally instead of being loaded into memory
+SPLIT_LINES_SIZE_LIMIT = 64 * 1024 * 1024
+# Numeric tokens are accepted within this absolute or relative error
+TOKEN_FLOAT_TOLERANCE = 1e-6
+# Piped output is compared against expected output in chunks of this size
+STREAM_CHUNK_SIZE = 64 * 1024
+# Buffer size of outputs read line by line from disk
+READ_BUFFER_SIZE = 1024 * 1024
+# Capacity requested for pipes to and from source code (at most 1 MiB for unprivileged users on Linux)
+PIPE_SIZE = 1024 * 1024
+# fcntl only names this command from Python 3.10 onwards, but Linux has supported it for long before
+F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031 if sys.platform.startswith('linux') else None)
+TC_DIR = "test_cases"
+CACHE_DIR = ".judge_cache"
+# Judge never changes its working directory, so paths based on it are computed once
+CWD = os.getcwd()
+TC_ROOT = os.path.join(CWD, TC_DIR)
+CACHE_ROOT = os.path.join(CWD, CACHE_DIR)
+VERDICT_CACHE_FILENAME = "verdicts.json"
+FILE_DIGEST_CACHE_FILENAME = "digests.json"
+MAX_CACHED_VERDICTS = 10000
+# Seconds a checker started in batch mode has to confirm it supports batch mode
+BATCH_HANDSHAKE_TIMEOUT = 5
+MAX_CACHED_BUILDS = 16
+MAX_CACHED_CHECKERS = 16
+# Expected outputs up to this size are kept in memory once read, up to MAX_CACHED_EXPECTED_OUTPUTS of them
+CACHED_EXPECTED_OUTPUT_SIZE_LIMIT = 1024 * 1024
+MAX_CACHED_EXPECTED_OUTPUTS = 128
+
+
+class CustomException(Exception):
+    """Represent a custom exception"""
+
+    def __init__(self, msg: str):
+        super().__init__(msg)
+        self.msg = msg
+
+
+@dataclass
+class ArgumentConfig():
+    '''
+    Object used to store config from CLI arguments
+    '''
+    # Initialize default configuration
+    filename: str = None
+    test_cases: str = None
+    input_strat: str = "automatic"
+    check_strat: str = "line"
+    checker_name: str = "checker.py"
+    check_function: bool = False
+    input_filename = "input.in"
+    output_filename = "input.ans"
+    # Two cores are left for the judge itself and the rest of the system
+    jobs: int = max(1, (os.cpu_count() or 1) - 2)
+    batch: int = 1
+    # Compilation cache can be disabled for every run with MINIJUDGE_CACHE=0
+    cache: bool = os.environ.get('MINIJUDGE_CACHE', '1') != '0'
+    dedup_inputs: bool = False
+    cache_verdicts: bool = False
+    fail_fast: bool = False
+
+
+class SubmissionFileNotFound(CustomException):
+    """Exception to be raise when submission file is not found"""
+
+    def __init__(self, submission_filename: str):
+        super().__init__(f"Submission file {submission_filename} not found")
+
+
+class TCNotFound(CustomException):
+    """Exception to be raise when test case is not found in current directory"""
+
+    def __init__(self, tc_dirname: str):
+        super().__init__(f"Test case not found in directory {tc_dirname}")
+
+
+class InvalidSubmissionFile(CustomException):
+    """Exception to be raise when invalid submission file is found"""
+
+
+class InvalidStrategy(CustomException):
+    """Exception to be raised when invalid strategy is found"""
+
+
+class CompilationError(CustomException):
+    """Exception to be raised when submission file fails to compile"""
+
+    def __init__(self, submission_filename: str):
+        super().__init__(f"Submission file {submission_filename} failed to compile")
+
+
+class CheckerNotFound(CustomException):
+    """Exception to be raised when checker file is not found"""
+
+    def __init__(self):
+        super().__init__("Checker file not found")
+
+
+class CompilingStrategy(ABC):
+    '''
+
+    Represent a generic Compiling Strategy
+
+    Constructor requires 2 parameters:
+        filename(str): name of source code file WITHOUT extension
+        filename_with_ext(str): name of source code file WITH extension
+
+    Compiled artifacts are written into build_dir, which defaults to the current directory,
+    and named after the source code file without its directory
+    Strategy is used as a context manager, cleaning up artifacts once submission was run
+
+    '''
+
+    def __init__(self, filename: str, filename_with_ext: str):
+        self.filename_without_extension = filename
+        self.filename_with_extension = filename_with_ext
+        self.artifact_name = os.path.basename(filename)
+        self.build_dir = CWD
+        self.temporary_build_dir = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+
+    def use_temporary_build_dir(self):
+        '''
+        Write compiled artifacts into a new temporary directory, removed on cleanup
+
+        Directory is created in shared memory when executables can be run from there,
+        so artifacts are never written to disk
+        '''
+        shm_dir = '/dev/shm'
+        use_shm = os.path.isdir(shm_dir) and hasattr(os, 'ST_NOEXEC') \
+            and not os.statvfs(shm_dir).f_flag & os.ST_NOEXEC
+        self.build_dir = tempfile.mkdtemp(
+            prefix='mini-judge-', dir=shm_dir if use_shm else None)
+        self.temporary_build_dir = True
+
+    @abstractmethod
+    def get_compile_command(self) -> List[str]:
+        """Returns argument list of compile command for source code file"""
+
+    @abstractmethod
+    def get_execute_command(self) -> List[str]:
+        """Returns argument list of execute command for source code file"""
+
+    @abstractmethod
+    def get_artifacts(self) -> List[str]:
+        """Returns paths of files produced by compile command, that execute command depends on"""
+
+    def cleanup(self):
+        """Clean up files produced by compile command after running submission (cached ones are kept)"""
+        if self.temporary_build_dir:
+            shutil.rmtree(self.build_dir, ignore_errors=True)
+
+
+class CppCompilingStrategy(CompilingStrategy):
+    """C++ Compiling Strategy (refer to CompilingStrategy class on how to initialize)"""
+
+    def get_compile_command(self) -> List[str]:
+        return [
+            'g++', '-std=c++17', '-pipe', '-Wshadow', '-Wall', '-o',
+            os.path.join(self.build_dir, self.artifact_name),
+            self.filename_with_extension,
+            '-O2', '-Wno-unused-result'
+        ]
+
+    def get_execute_command(self) -> List[str]:
+        # Use an absolute path so the executable can be run from any test case directory
+        return self.get_artifacts()
+
+    def get_artifacts(self) -> List[str]:
+        executable = os.path.join(
+            self.build_dir, self.artifact_name)
+        if sys.platform == 'win32':
+            executable += '.exe'
+        return [executable]
+
+
+class JavaCompilingStrategy(CompilingStrategy):
+    """Java Compiling Strategy (refer to CompilingStrategy class on how to initialize)"""
+
+    def get_compile_command(self) -> List[str]:
+        return ['javac', '-d', self.build_dir, self.filename_with_extension]
+
+    def get_execute_command(self) -> List[str]:
+        # Solutions run briefly, so skip the optimizing JIT tier and G1 heap setup,
+        # and load core classes from the shared archive
+        return [
+            'java', '-XX:TieredStopAtLevel=1', '-Xshare:auto', '-XX:+UseSerialGC',
+            '-cp', self.build_dir, self.artifact_name
+        ]
+
+    def get_artifacts(self) -> List[str]:
+        return [os.path.join(self.build_dir, f'{self.artifact_name}.class')]
+
+
+def link_or_copy(src: str, dst: str):
+    """Make file at src also appear at dst, hard-linking it instead of copying its data when possible"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+class OutputCache():
+    '''
+
+    Cache of user output for every distinct test case input that was already run
+    Assumes source code is deterministic, so identical input always produces identical output
+
+    '''
+
+    def __init__(self):
+        os.makedirs(CACHE_ROOT, exist_ok=True)
+        # Keep cached outputs on the same filesystem as test cases, so they can be hard-linked
+        self.output_dir = tempfile.mkdtemp(prefix='outputs-', dir=CACHE_ROOT)
+        self.outputs = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def hash_input(input_filepath: str) -> str:
+        """Returns digest of the content of an input file"""
+        with open(input_filepath, 'rb') as input_fileobj:
+            return hashlib.blake2b(input_fileobj.read(), digest_size=16).hexdigest()
+
+    def restore(self, input_digest: str, user_output_filepath: str) -> bool:
+        '''
+        Place cached output of an input at user output path
+
+        Returns True if output of that input was cached, False otherwise
+        '''
+        with self.lock:
+            cached_filepath = self.outputs.get(input_digest)
+
+        if cached_filepath is None:
+            return False
+
+        # Removing directly saves a stat when there is no previous output
+        try:
+            os.remove(user_output_filepath)
+        except FileNotFoundError:
+            pass
+        link_or_copy(cached_filepath, user_output_filepath)
+        return True
+
+    def store(self, input_digest: str, user_output_filepath: str):
+        """Cache user output produced for an input"""
+        with self.lock:
+            if input_digest in self.outputs:
+                return
+            cached_filepath = os.path.join(self.output_dir, input_digest)
+            link_or_copy(user_output_filepath, cached_filepath)
+            self.outputs[input_digest] = cached_filepath
+
+    def cleanup(self):
+        """Remove every cached output"""
+        shutil.rmtree(self.output_dir)
+
+
+class VerdictCache():
+    '''
+
+    Persistent cache of verdicts, keyed on submission, judging configuration and test case content
+    Least recently used entries are evicted once more than MAX_CACHED_VERDICTS are stored
+
+    Digests of test case files are persisted as well, so unchanged files are not read again
+
+    '''
+
+    def __init__(self, parsed_args: ArgumentConfig, compiling_strategy: CompilingStrategy):
+        self.parsed_args = parsed_args
+        self.filepath = os.path.join(
+            CACHE_ROOT, VERDICT_CACHE_FILENAME)
+        self.file_digests_filepath = os.path.join(
+            CACHE_ROOT, FILE_DIGEST_CACHE_FILENAME)
+        self.submission_digest = VerdictCache.get_submission_digest(
+            parsed_args, compiling_strategy)
+
+        self.verdicts = VerdictCache.load_json(self.filepath)
+        self.cached_file_digests = VerdictCache.load_json(self.file_digests_filepath)
+        # Only digests of files used by this run are written back
+        self.file_digests = {}
+
+    @staticmethod
+    def load_json(filepath: str) -> dict:
+        """Returns content of a JSON cache file, or an empty dict if it is missing or corrupted"""
+        try:
+            with open(filepath, 'r', encoding='utf-8') as cache_fileobj:
+                return json.load(cache_fileobj)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def update_with_file(digest, filepath: str):
+        """Feed content of a file into a digest, without copying it into a Python object"""
+        with open(filepath, 'rb') as fileobj:
+            # Empty files cannot be memory-mapped
+            if os.fstat(fileobj.fileno()).st_size == 0:
+                return
+            with mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as file_mm:
+                digest.update(file_mm)
+
+    @staticmethod
+    def get_submission_digest(parsed_args: ArgumentConfig, compiling_strategy: CompilingStrategy) -> bytes:
+        """Returns digest of everything besides test case content that affects a verdict"""
+        digest = hashlib.sha256()
+        VerdictCache.update_with_file(
+            digest, compiling_strategy.filename_with_extension)
+        digest.update(shlex.join(compiling_strategy.get_compile_command()).encode())
+        digest.update(
+            f'{parsed_args.input_strat}\n{parsed_args.check_strat}\n{parsed_args.batch}\n'
+            f'{parsed_args.check_function}'.encode())
+        if parsed_args.check_strat == 'checker':
+            VerdictCache.update_with_file(digest, parsed_args.checker_name)
+        return digest.digest()
+
+    def get_file_digest(self, filepath: str) -> str:
+        '''
+        Returns digest of the content of a file
+
+        Digest is only computed again if inode, modification time or size of the file changed
+        '''
+        file_stat = os.stat(filepath)
+        file_id = [file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size]
+
+        cached_digest = self.cached_file_digests.get(filepath)
+        if cached_digest is not None and cached_digest[:3] == file_id:
+            file_digest = cached_digest[3]
+        else:
+            digest = hashlib.sha256()
+            VerdictCache.update_with_file(digest, filepath)
+            file_digest = digest.hexdigest()
+
+        self.file_digests[filepath] = file_id + [file_digest]
+        return file_digest
+
+    def get_key(self, tc_dir: str) -> str:
+        """Returns cache key of a test case for the current submission"""
+        digest = hashlib.sha256(self.submission_digest)
+        digest.update(bytes.fromhex(self.get_file_digest(
+            os.path.join(tc_dir, self.parsed_args.input_filename))))
+        digest.update(bytes.fromhex(self.get_file_digest(
+            os.path.join(tc_dir, self.parsed_args.output_filename))))
+        return digest.hexdigest()
+
+    def lookup(self, key: str):
+        '''
+        Look up a cached verdict
+
+        Returns (passed, message) if verdict is cached, None otherwise
+        '''
+        if key not in self.verdicts:
+            return None
+
+        # Move entry to the end, which marks it as most recently used
+        passed, message = self.verdicts[key] = self.verdicts.pop(key)
+        return bool(passed), message
+
+    def store(self, key: str, passed: bool, message: str):
+        """Cache verdict of a test case"""
+        self.verdicts.pop(key, None)
+        self.verdicts[key] = [int(passed), message]
+
+    def save(self):
+        """Write cached verdicts to disk, evicting least recently used ones"""
+        for key in list(self.verdicts)[:max(0, len(self.verdicts) - MAX_CACHED_VERDICTS)]:
+            del self.verdicts[key]
+
+        os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+        with open(self.filepath, 'w', encoding='utf-8') as cache_fileobj:
+            json.dump(self.verdicts, cache_fileobj)
+        with open(self.file_digests_filepath, 'w', encoding='utf-8') as cache_fileobj:
+            json.dump(self.file_digests, cache_fileobj)
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_EXPECTED_OUTPUTS)
+def read_cached_file(filepath: str, mtime_ns: int, size: int) -> bytes:
+    """Read content of a file, cached by its path, modification time and size"""
+    with open(filepath, 'rb') as fileobj:
+        return fileobj.read()
+
+
+def read_expected_output(filepath: str) -> bytes:
+    '''
+    Read content of an expected output file
+
+    Small files are read from disk only once per run, unless they are modified
+    '''
+    file_stat = os.stat(filepath)
+    if file_stat.st_size > CACHED_EXPECTED_OUTPUT_SIZE_LIMIT:
+        with open(filepath, 'rb') as fileobj:
+            return fileobj.read()
+
+    return read_cached_file(filepath, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def run_process(execute_argv: List[str], stdin_fileobj, stdout_fileobj) -> int:
+    '''
+    Run the provided command with the given files as its stdin and stdout
+
+    Uses os.posix_spawnp when available, which skips the Python-level setup of subprocess
+    and lets the C library spawn the process without copying the parent's page tables
+
+    Returns exit code of the process
+
+    '''
+    if not hasattr(os, 'posix_spawnp'):
+        return subprocess.Popen(execute_argv, stdin=stdin_fileobj, stdout=stdout_fileobj,
+                                close_fds=False).wait()
+
+    pid = os.posix_spawnp(execute_argv[0], execute_argv, os.environ, file_actions=[
+        (os.POSIX_SPAWN_DUP2, stdin_fileobj.fileno(), 0),
+        (os.POSIX_SPAWN_DUP2, stdout_fileobj.fileno(), 1)
+    ])
+    _, status = os.waitpid(pid, 0)
+    if hasattr(os, 'waitstatus_to_exitcode'):
+        return os.waitstatus_to_exitcode(status)
+
+    # Python 3.8 has no waitstatus_to_exitcode, so decode the status the same way Popen does
+    return -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+
+
+def enlarge_pipe(pipe_fileobj):
+    '''
+    Raise capacity of a pipe to PIPE_SIZE where supported, so a process writing a lot of
+    output into it has to wait for the reader less often
+
+    Unlike pipesize argument of subprocess.Popen, failing to do so is not an error
+    '''
+    if pipe_fileobj is None or fcntl is None or F_SETPIPE_SZ is None:
+        return
+
+    try:
+        fcntl.fcntl(pipe_fileobj.fileno(), F_SETPIPE_SZ, PIPE_SIZE)
+    except OSError:
+        # Capacity is above the limit allowed for this user
+        pass
+
+
+class InputStrategy(ABC):
+    """Represent a generic Input strategy"""
+
+    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
+        '''
+
+        Generic initialization of an input strategy
+        Generate path of input and user output file
+        (test case directory is expected to be validated by index_test_cases)
+
+        '''
+        self.parsed_args = parsed_args
+        self.input_filepath = os.path.join(tc_dir, parsed_args.input_filename)
+        self.user_output_filepath = os.path.join(tc_dir, USER_OUTPUT_FILENAME)
+
+    @abstractmethod
+    def execute_strategy(self, execute_argv: List[str]):
+        '''
+        Run the provided command inside the environment of an input strategy
+
+        Parameters:
+        execute_argv(list[str]): argument list of the command to be executed
+
+        '''
+
+    def stream_strategy(self, execute_argv: List[str]) -> subprocess.Popen:
+        '''
+        Start the provided command inside the environment of an input strategy,
+        with its output piped back instead of written to the user output file
+
+        Returns the started process
+
+        Parameters:
+        execute_argv(list[str]): argument list of the command to be executed
+
+        '''
+        raise InvalidStrategy(
+            f"{type(self).__name__} does not support streaming output")
+
+
+class AutomaticInputStrategy(InputStrategy):
+    '''
+
+    Automatic Input strategy
+    Use case: When source code is expected to read data from stdin
+
+    '''
+
+    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
+        super().__init__(parsed_args, tc_dir)
+        self.input_fileobj = None
+        self.user_output_fileobj = None
+
+    def __cleanup(self):
+        """Do necessary clean-up after executing the strategy"""
+        self.input_fileobj.close()
+        if self.user_output_fileobj:
+            self.user_output_fileobj.close()
+
+    def __start_process(self, execute_argv: List[str], stdout) -> subprocess.Popen:
+        """Start the provided command with test case input as stdin"""
+        process = subprocess.Popen(execute_argv, stdin=self.input_fileobj, stdout=stdout,
+                                   close_fds=False, bufsize=STREAM_CHUNK_SIZE)
+        enlarge_pipe(process.stdout)
+        return process
+
+    def execute_strategy(self, execute_argv: List[str]):
+        self.input_fileobj = open(self.input_filepath, 'rb')
+        # Child writes straight into the descriptor, so no Python-side buffer is needed
+        self.user_output_fileobj = open(self.user_output_filepath, 'wb', buffering=0)
+        run_process(execute_argv, self.input_fileobj, self.user_output_fileobj)
+        self.__cleanup()
+
+    def stream_strategy(self, execute_argv: List[str]) -> subprocess.Popen:
+        self.input_fileobj = open(self.input_filepath, 'rb')
+        p = self.__start_process(execute_argv, subprocess.PIPE)
+        self.__cleanup()
+        return p
+
+
+class ManualInputStrategy(InputStrategy):
+    '''
+
+    Manual Input Strategy
+    Use case: When source code is expected to read data directly from text file
+
+    Source code is executed inside the test case directory, so the input file
+    can be opened by name without being moved
+
+    '''
+
+    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
+        super().__init__(parsed_args, tc_dir)
+        self.tc_dir = tc_dir
+        self.user_output_fileobj = None
+
+    def __cleanup(self):
+        """Do necessary clean-up after executing the strategy"""
+        self.user_output_fileobj.close()
+
+    def __start_process(self, execute_argv: List[str], stdout) -> subprocess.Popen:
+        """Start the provided command inside the test case directory"""
+        process = subprocess.Popen(execute_argv, stdout=stdout, close_fds=False,
+                                   cwd=self.tc_dir, bufsize=STREAM_CHUNK_SIZE)
+        enlarge_pipe(process.stdout)
+        return process
+
+    def execute_strategy(self, execute_argv: List[str]):
+        self.user_output_fileobj = open(self.user_output_filepath, 'wb', buffering=0)
+        execute_process = self.__start_process(
+            execute_argv, self.user_output_fileobj)
+        execute_process.wait()
+        self.__cleanup()
+
+    def stream_strategy(self, execute_argv: List[str]) -> subprocess.Popen:
+        return self.__start_process(execute_argv, subprocess.PIPE)
+
+
+class PersistentWorkerStrategy(InputStrategy):
+    '''
+
+    Persistent Worker Strategy
+    Use case: When source code keeps running across test cases. For every test case, it reads
+    input up to a line containing only EOT (\\x04), then prints output followed by the same line
+
+    Source code is started once per worker thread and reused by every test case run on that thread
+
+    '''
+
+    EOT = b'\x04'
+
+    workers = threading.local()
+    processes = []
+    processes_lock = threading.Lock()
+
+    @classmethod
+    def get_process(cls, execute_argv: List[str]) -> subprocess.Popen:
+        """Returns the process of current worker thread, starting it if needed"""
+        process = getattr(cls.workers, 'process', None)
+
+        if process is None or process.poll() is not None:
+            process = subprocess.Popen(execute_argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                       close_fds=False, bufsize=STREAM_CHUNK_SIZE)
+            enlarge_pipe(process.stdin)
+            enlarge_pipe(process.stdout)
+            cls.workers.process = process
+            with cls.processes_lock:
+                cls.processes.append(process)
+
+        return process
+
+    @classmethod
+    def terminate_workers(cls):
+        """Terminate every process started by this strategy"""
+        with cls.processes_lock:
+            for process in cls.processes:
+                process.terminate()
+                process.wait()
+            cls.processes.clear()
+
+    @staticmethod
+    def write_input(process: subprocess.Popen, data: bytes):
+        """Write input of a test case into stdin of the process"""
+        try:
+            process.stdin.write(data)
+            process.stdin.flush()
+        except BrokenPipeError:
+            # Process exited early, its output will be checked as is
+            pass
+
+    def execute_strategy(self, execute_argv: List[str]):
+        process = PersistentWorkerStrategy.get_process(execute_argv)
+
+        with open(self.input_filepath, 'rb') as input_fileobj:
+            data = input_fileobj.read()
+        if data and not data.endswith(b'\n'):
+            data += b'\n'
+
+        # Write input from another thread, so process cannot block on a full stdout pipe
+        # while input is still being written
+        writer = threading.Thread(target=PersistentWorkerStrategy.write_input,
+                                  args=(process, data + PersistentWorkerStrategy.EOT + b'\n'))
+        writer.start()
+
+        with open(self.user_output_filepath, 'wb') as user_output_fileobj:
+            for line in iter(process.stdout.readline, b''):
+                if line.rstrip(b'\r\n') == PersistentWorkerStrategy.EOT:
+                    break
+                user_output_fileobj.write(line)
+
+        writer.join()
+
+
+atexit.register(PersistentWorkerStrategy.terminate_workers)
+
+
+class BatchedInputStrategy(InputStrategy):
+    '''
+
+    Batched Input Strategy
+    Use case: When source code reads the number of test cases from the first line of stdin,
+    followed by the input of each test case
+
+    Input files of several test cases are concatenated and source code is executed once.
+    Output is then split back into each test case directory, using the number of lines
+    of its expected output
+
+    '''
+
+    def __init__(self, parsed_args: ArgumentConfig, tc_dirs: List[str]):
+        self.parsed_args = parsed_args
+        self.input_filepaths = []
+        self.user_output_filepaths = []
+        self.expected_output_filepaths = []
+
+        for tc_dir in tc_dirs:
+            self.input_filepaths.append(
+                os.path.join(tc_dir, parsed_args.input_filename))
+            self.user_output_filepaths.append(
+                os.path.join(tc_dir, USER_OUTPUT_FILENAME))
+            self.expected_output_filepaths.append(
+                os.path.join(tc_dir, parsed_args.output_filename))
+
+    def __write_combined_input(self, combined_input_fileobj):
+        """Write number of test cases followed by input of every test case"""
+        combined_input_fileobj.write(f'{len(self.input_filepaths)}\n'.encode())
+        for input_filepath in self.input_filepaths:
+            with open(input_filepath, 'rb') as input_fileobj:
+                data = input_fileobj.read()
+            combined_input_fileobj.write(data)
+            if data and not data.endswith(b'\n'):
+                combined_input_fileobj.write(b'\n')
+        combined_input_fileobj.seek(0)
+
+    def __split_combined_output(self, combined_output_fileobj):
+        """Split output of source code into user output file of every test case"""
+        combined_output_fileobj.seek(0)
+        for user_output_filepath, expected_output_filepath in zip(
+                self.user_output_filepaths, self.expected_output_filepaths):
+            # Expected output is kept in memory, so it is not read again when it is checked
+            expected_output = read_expected_output(expected_output_filepath)
+            line_count = expected_output.count(b'\n')
+            if expected_output and not expected_output.endswith(b'\n'):
+                line_count += 1
+
+            with open(user_output_filepath, 'wb') as user_output_fileobj:
+                for _ in range(line_count):
+                    user_output_fileobj.write(
+                        combined_output_fileobj.readline())
+
+    def execute_strategy(self, execute_argv: List[str]):
+        with tempfile.TemporaryFile() as combined_input_fileobj, \
+                tempfile.TemporaryFile() as combined_output_fileobj:
+            self.__write_combined_input(combined_input_fileobj)
+            run_process(execute_argv, combined_input_fileobj,
+                        combined_output_fileobj)
+            self.__split_combined_output(combined_output_fileobj)
+
+
+class CheckSolutionStrategy(ABC):
+    '''
+
+    Represent a strategy used for verifying output produced by source code
+
+    Strategies that stream output compare it while source code is running, and expect the
+    running process to be assigned to their process attribute instead of a user output file
+
+    '''
+
+    streams_output = False
+
+    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
+        self.parsed_args = parsed_args
+        self.user_output_filepath = os.path.join(tc_dir, USER_OUTPUT_FILENAME)
+        self.expected_output_filepath = os.path.join(
+            tc_dir, parsed_args.output_filename)
+
+        self.user_output_fileobj = None
+        self.expected_output_fileobj = None
+
+        # Optional details on why the solution was rejected
+        self.message = None
+
+    def setup_strategy(self):
+        """Setup steps needs to be done before verifying solution (outputs are read as bytes)"""
+        self.user_output_fileobj = open(
+            self.user_output_filepath, 'rb', buffering=READ_BUFFER_SIZE)
+        self.expected_output_fileobj = open(
+            self.expected_output_filepath, 'rb', buffering=READ_BUFFER_SIZE)
+
+    @abstractmethod
+    def check_output(self) -> Literal['AC', 'WA']:
+        '''
+
+        Determines whether solution is correct
+
+        Returns "AC" if solution is correct, "WA" otherwise
+
+        '''
+
+    def cleanup(self):
+        """Clean up stuffs after checking solution"""
+        self.user_output_fileobj.close()
+        self.expected_output_fileobj.close()
+        os.remove(self.user_output_filepath)
+
+
+class LineCompareCheckStrategy(CheckSolutionStrategy):
+    """
+    A strategy of verifying solution by checking user output against expected output line by line
+    """
+
+    @staticmethod
+    def find_first_difference(user_mm: mmap.mmap, expected_mm: mmap.mmap) -> int:
+        '''
+        Returns offset of the first byte that differs between two equally sized outputs,
+        or -1 if they are identical
+
+        Outputs are compared one block of READ_BUFFER_SIZE bytes at a time, so neither is
+        copied into memory as a whole
+        '''
+        for block_start in range(0, len(user_mm), READ_BUFFER_SIZE):
+            block_end = block_start + READ_BUFFER_SIZE
+            user_block = user_mm[block_start:block_end]
+            expected_block = expected_mm[block_start:block_end]
+            if user_block == expected_block:
+                continue
+
+            if np is None:
+                return block_start + next(idx for idx, (user_byte, expected_byte)
+                                          in enumerate(zip(user_block, expected_block))
+                                          if user_byte != expected_byte)
+            user_bytes = np.frombuffer(user_block, dtype=np.uint8)
+            expected_bytes = np.frombuffer(expected_block, dtype=np.uint8)
+            return block_start + int(np.flatnonzero(user_bytes != expected_bytes)[0])
+
+        return -1
+
+    @staticmethod
+    def iterate_normalized_blocks(output_mm: mmap.mmap):
+        '''
+        Yield an output in blocks of about READ_BUFFER_SIZE bytes, with CRLF line endings replaced
+        by LF and trailing line breaks left out
+        '''
+        # Trailing line breaks are stripped after CRLF line endings are replaced
+        output_end = len(output_mm)
+        while output_end and output_mm[output_end - 1] == ord('\n'):
+            output_end -= 1
+            if output_end and output_mm[output_end - 1] == ord('\r'):
+                output_end -= 1
+
+        block_start = 0
+        while block_start < output_end:
+            block_end = min(block_start + READ_BUFFER_SIZE, output_end)
+            # CR at the end of a block may start a CRLF continuing in the next block
+            if block_end < output_end and output_mm[block_end - 1] == ord('\r'):
+                block_end -= 1
+            block = output_mm[block_start:block_end]
+            yield block.replace(b'\r\n', b'\n') if b'\r' in block else block
+            block_start = block_end
+
+    @staticmethod
+    def normalized_outputs_match(user_mm: mmap.mmap, expected_mm: mmap.mmap) -> bool:
+        """Determine whether outputs match up to CRLF line endings and trailing line breaks"""
+        user_blocks = LineCompareCheckStrategy.iterate_normalized_blocks(user_mm)
+        expected_blocks = LineCompareCheckStrategy.iterate_normalized_blocks(expected_mm)
+
+        # Normalized blocks of both outputs differ in size, so only their common prefix is compared
+        user_block = expected_block = b''
+        while True:
+            user_block = user_block or next(user_blocks, b'')
+            expected_block = expected_block or next(expected_blocks, b'')
+            if not user_block or not expected_block:
+                return user_block == expected_block
+
+            common_size = min(len(user_block), len(expected_block))
+            if user_block[:common_size] != expected_block[:common_size]:
+                return False
+            user_block, expected_block = user_block[common_size:], expected_block[common_size:]
+
+    def compare_mapped_outputs(self) -> Literal['AC', 'WA', None]:
+        '''
+
+        Compare memory-mapped user output and expected output block by block, without a
+        Python-level loop over lines
+
+        Returns "AC" if both files are identical (up to CRLF line endings and trailing line
+        breaks), "WA" if they are known to differ (setting the first differing line as message),
+        or None if the line-by-line comparison is needed to decide
+
+        Sizes of both files are kept in user_size and expected_size
+
+        '''
+        with open(self.user_output_filepath, 'rb') as user_output_fileobj, \
+                open(self.expected_output_filepath, 'rb') as expected_output_fileobj:
+            # Sizes are taken from the opened files, so neither path is looked up again
+            user_size = self.user_size = os.fstat(user_output_fileobj.fileno()).st_size
+            expected_size = self.expected_size = os.fstat(
+                expected_output_fileobj.fileno()).st_size
+
+            # Empty files cannot be memory-mapped
+            if user_size == 0 or expected_size == 0:
+                return "AC" if user_size == expected_size else None
+
+            with mmap.mmap(user_output_fileobj.fileno(), 0,
+                           access=mmap.ACCESS_READ) as user_mm, \
+                    mmap.mmap(expected_output_fileobj.fileno(), 0,
+                              access=mmap.ACCESS_READ) as expected_mm:
+                first_diff = -1
+                if user_size == expected_size:
+                    first_diff = LineCompareCheckStrategy.find_first_difference(
+                        user_mm, expected_mm)
+                    if first_diff == -1:
+                        return "AC"
+
+                has_carriage_return = user_mm.find(b'\r') != -1 or expected_mm.find(b'\r') != -1
+
+                # Outputs that only differ in line endings or trailing line breaks still match
+                if has_carriage_return or user_size != expected_size:
+                    if LineCompareCheckStrategy.normalized_outputs_match(user_mm, expected_mm):
+                        return "AC"
+                    return None
+
+                # Without carriage returns, equally sized files that differ cannot match line by
+                # line, so large files are diagnosed by counting line breaks before the difference
+                if user_size <= VECTORIZED_DIFF_THRESHOLD:
+                    return None
+
+                line_number = 1
+                for block_start in range(0, first_diff, READ_BUFFER_SIZE):
+                    block_end = min(block_start + READ_BUFFER_SIZE, first_diff)
+                    line_number += expected_mm[block_start:block_end].count(b'\n')
+
+        self.message = f"first difference at line {line_number}"
+        return "WA"
+
+    def compare_split_lines(self) -> Literal['AC', 'WA']:
+        '''
+
+        Compare user output and expected output by splitting both files into lines at once,
+        letting list comparison do the line-by-line work
+
+        Returns "AC" if every expected line matches, "WA" otherwise (setting the first
+        differing line as message)
+
+        '''
+        with open(self.user_output_filepath, 'rb') as user_output_fileobj:
+            user_lines = user_output_fileobj.read().splitlines()
+        expected_lines = read_expected_output(self.expected_output_filepath).splitlines()
+
+        # Missing user lines compare as empty lines, extra user lines are ignored
+        if len(user_lines) < len(expected_lines):
+            user_lines.extend([b''] * (len(expected_lines) - len(user_lines)))
+        else:
+            del user_lines[len(expected_lines):]
+
+        if user_lines == expected_lines:
+            return "AC"
+
+        line_number = next(idx for idx, (user_line, expected_line)
+                           in enumerate(zip(user_lines, expected_lines), 1)
+                           if user_line != expected_line)
+        self.message = f"first difference at line {line_number}"
+        return "WA"
+
+    def skip_identical_blocks(self) -> int:
+        '''
+
+        Skip leading blocks of READ_BUFFER_SIZE bytes that are identical in user output and
+        expected output, comparing each pair of blocks at once instead of line by line
+
+        Both files are left at the start of the line following the last skipped LF
+        Returns number of lines skipped, with lines ended by LF, CRLF or a lone CR
+
+        '''
+        read_user_block = self.user_output_fileobj.read
+        read_expected_block = self.expected_output_fileobj.read
+        block_start = line_start = line_breaks = 0
+        # CRs after the last skipped LF end lines that are not skipped
+        trailing_carriage_returns = 0
+        ends_with_carriage_return = False
+
+        while True:
+            user_block = read_user_block(READ_BUFFER_SIZE)
+            if not user_block or user_block != read_expected_block(READ_BUFFER_SIZE):
+                break
+
+            carriage_returns = user_block.count(b'\r')
+            line_breaks += user_block.count(b'\n') + carriage_returns
+            if carriage_returns:
+                line_breaks -= user_block.count(b'\r\n')
+            # CRLF split between two blocks ends a single line
+            if ends_with_carriage_return and user_block.startswith(b'\n'):
+                line_breaks -= 1
+            ends_with_carriage_return = user_block.endswith(b'\r')
+
+            last_line_break = user_block.rfind(b'\n')
+            if last_line_break != -1:
+                line_start = block_start + last_line_break + 1
+                trailing_carriage_returns = user_block.count(b'\r', last_line_break)
+            else:
+                trailing_carriage_returns += user_block.count(b'\r')
+            block_start += len(user_block)
+
+        self.user_output_fileobj.seek(line_start)
+        self.expected_output_fileobj.seek(line_start)
+        return line_breaks - trailing_carriage_returns
+
+    @staticmethod
+    def iterate_line_blocks(output_fileobj: io.BufferedReader):
+        '''
+        Yield lines of an output opened as bytes in lists, one list per block of READ_BUFFER_SIZE
+        bytes read, without their line breaks
+
+        Lines are split on LF, CRLF and a lone CR like bytes.splitlines
+        '''
+        pending = bytearray()
+        follows_carriage_return = False
+        for block in iter(functools.partial(output_fileobj.read, READ_BUFFER_SIZE), b''):
+            # LF of a CRLF split between two blocks was already taken as a line break
+            if follows_carriage_return and block.startswith(b'\n'):
+                block = block[1:]
+            follows_carriage_return = block.endswith(b'\r')
+
+            pending += block
+            # Lines are only split once a line break is read, so a long line is not split repeatedly
+            if b'\n' not in block and b'\r' not in block:
+                continue
+
+            lines = bytes(pending).splitlines()
+            # Last line continues in the next block unless the block ends with a line break
+            pending = bytearray() if block.endswith((b'\n', b'\r')) else bytearray(lines.pop())
+            yield lines
+
+        if pending:
+            yield bytes(pending).splitlines()
+
+    def check_output(self):
+        verdict = self.compare_mapped_outputs()
+        if verdict is None and max(self.user_size, self.expected_size) <= SPLIT_LINES_SIZE_LIMIT:
+            verdict = self.compare_split_lines()
+
+        if verdict is not None:
+            os.remove(self.user_output_filepath)
+            return verdict
+
+        # Huge outputs are compared one block of lines at a time, from the first block that differs
+        self.setup_strategy()
+        line_number = self.skip_identical_blocks() + 1
+        verdict = "AC"
+        user_line_blocks = LineCompareCheckStrategy.iterate_line_blocks(self.user_output_fileobj)
+        user_lines = []
+        for expected_lines in LineCompareCheckStrategy.iterate_line_blocks(
+                self.expected_output_fileobj):
+            while len(user_lines) < len(expected_lines):
+                next_user_lines = next(user_line_blocks, None)
+                # Missing user lines compare as empty lines, like in compare_split_lines
+                if next_user_lines is None:
+                    user_lines.extend([b''] * (len(expected_lines) - len(user_lines)))
+                    break
+                user_lines.extend(next_user_lines)
+
+            if user_lines[:len(expected_lines)] != expected_lines:
+                verdict = "WA"
+                line_number += next(idx for idx, (user_line, expected_line)
+                                    in enumerate(zip(user_lines, expected_lines))
+                                    if user_line != expected_line)
+                self.message = f"first difference at line {line_number}"
+                break
+
+            del user_lines[:len(expected_lines)]
+            line_number += len(expected_lines)
+
+        self.cleanup()
+        return verdict
+
+
+class StreamingLineCompareCheckStrategy(CheckSolutionStrategy):
+    """
+    A strategy of verifying solution by checking output of source code against expected output
+    line by line while source code is running, terminating it on the first mismatch
+    """
+
+    streams_output = True
+
+    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
+        super().__init__(parsed_args, tc_dir)
+        self.process = None
+
+    def setup_strategy(self):
+        self.expected_output_fileobj = open(
+            self.expected_output_filepath, 'rb')
+
+    @staticmethod
+    def iterate_lines(head: bytes, fileobj):
+        """Yield lines of head, followed by the remaining lines of a file object"""
+        lines = io.BytesIO(head).readlines()
+        # Last line of head may continue in file object
+        if lines and not lines[-1].endswith(b'\n'):
+            lines[-1] += fileobj.readline()
+        yield from lines
+        # File object is not delegated to with yield from, which would close it along with generator
+        for line in fileobj:
+            yield line
+
+    def compare_lines(self, user_head: bytes, expected_head: bytes, line_number: int) -> Literal['AC', 'WA']:
+        '''
+
+        Compare the rest of user output and expected output line by line
+
+        Returns "AC" if every expected line matches, "WA" otherwise (setting the first
+        differing line as message)
+
+        Parameters:
+        user_head(bytes): output of source code already read, starting at beginning of a line
+        expected_head(bytes): expected output already read, starting at beginning of a line
+        line_number(int): line number of the first line of both heads
+
+        '''
+        # Bind attributes used in the loop to local names
+        user_lines = StreamingLineCompareCheckStrategy.iterate_lines(
+            user_head, self.process.stdout)
+        next_user_line = user_lines.__next__
+        rstrip = bytes.rstrip
+        for line_number, line in enumerate(StreamingLineCompareCheckStrategy.iterate_lines(
+                expected_head, self.expected_output_fileobj), line_number):
+            try:
+                user_line = rstrip(next_user_line(), b'\r\n')
+            except StopIteration:
+                user_line = b''
+            expected_line = rstrip(line, b'\r\n')
+
+            if user_line != expected_line:
+                self.message = f"first difference at line {line_number}"
+                return "WA"
+
+        return "AC"
+
+    def check_output(self):
+        self.setup_strategy()
+        verdict = "AC"
+        read_user = self.process.stdout.read
+        read_expected = self.expected_output_fileobj.read
+
+        # Compare whole chunks while output matches, only splitting into lines once it does not
+        line_number = 1
+        line_start = bytearray()
+        while True:
+            expected_chunk = read_expected(STREAM_CHUNK_SIZE)
+            if not expected_chunk:
+                # Last expected line without line break still has to end where the user line ends
+                if line_start:
+                    verdict = self.compare_lines(bytes(line_start), bytes(line_start), line_number)
+                break
+
+            user_chunk = read_user(len(expected_chunk))
+            if user_chunk != expected_chunk:
+                verdict = self.compare_lines(
+                    bytes(line_start) + user_chunk, bytes(line_start) + expected_chunk, line_number)
+                break
+
+            # Keep the matched part of the current line, so it can be compared as a whole
+            last_line_break = expected_chunk.rfind(b'\n')
+            if last_line_break == -1:
+                line_start += expected_chunk
+            else:
+                line_number += expected_chunk.count(b'\n')
+                line_start = bytearray(expected_chunk[last_line_break + 1:])
+
+        self.cleanup(verdict)
+        return verdict
+
+    def cleanup(self, verdict: Literal['AC', 'WA'] = "AC"):
+        """Clean up stuffs after checking solution, terminating source code if it was rejected"""
+        self.expected_output_fileobj.close()
+
+        if verdict == "WA":
+            self.process.terminate()
+        else:
+            # Output past expected output is not checked, but source code is still run to completion
+            while self.process.stdout.read(STREAM_CHUNK_SIZE):
+                pass
+
+        self.process.stdout.close()
+        self.process.wait()
+
+
+class TokensCheckStrategy(CheckSolutionStrategy):
+    """
+    A strategy of verifying solution by checking user output against expected output token by token,
+    accepting numbers within TOKEN_FLOAT_TOLERANCE of the expected ones
+    """
+
+    @staticmethod
+    def tokens_match(user_token: bytes, expected_token: bytes) -> bool:
+        """Determine whether differing tokens represent close enough numbers"""
+        try:
+            user_number, expected_number = float(user_token), float(expected_token)
+        except ValueError:
+            return False
+
+        return abs(user_number - expected_number) <= TOKEN_FLOAT_TOLERANCE * max(1, abs(expected_number))
+
+    def check_output(self):
+        with open(self.user_output_filepath, 'rb') as user_output_fileobj:
+            user_tokens = user_output_fileobj.read().split()
+        expected_tokens = read_expected_output(self.expected_output_filepath).split()
+        os.remove(self.user_output_filepath)
+
+        # Identical outputs are accepted by a single list comparison
+        if user_tokens == expected_tokens:
+            return "AC"
+
+        tokens_match = TokensCheckStrategy.tokens_match
+        for token_number, (user_token, expected_token) in enumerate(zip(user_tokens, expected_tokens), 1):
+            if user_token != expected_token and not tokens_match(user_token, expected_token):
+                self.message = f"first difference at token {token_number}"
+                return "WA"
+
+        if len(user_tokens) != len(expected_tokens):
+            self.message = f"expected {len(expected_tokens)} tokens, found {len(user_tokens)}"
+            return "WA"
+
+        return "AC"
+
+
+class BatchChecker():
+    '''
+
+    Long-lived checker process shared by every test case of a run
+    Checker is started with --batch argument. It first reads a line containing BATCH, and confirms
+    it supports batch mode by printing a line containing BATCH 1. For every test case, it then reads
+    a line containing a JSON object with "input", "output" and "answer" file paths, and prints a
+    line with AC or WA
+
+    Checker that does not confirm batch mode is run once per test case instead
+
+    '''
+
+    HANDSHAKE = b'BATCH\n'
+    HANDSHAKE_REPLY = b'BATCH 1'
+
+    def __init__(self, checker_argv: List[str]):
+        # Error output of checker is discarded, as checker not supporting batch mode is
+        # expected to fail on the unknown argument
+        self.process = subprocess.Popen(checker_argv + ['--batch'], stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.lock = threading.Lock()
+        self.supported = self.handshake()
+        if not self.supported:
+            self.close()
+
+    def handshake(self) -> bool:
+        '''
+        Ask checker whether it supports batch mode, before sending any test case to it
+
+        Checker that does not reply within BATCH_HANDSHAKE_TIMEOUT seconds is stopped
+        '''
+        replies = []
+
+        def read_reply():
+            try:
+                self.process.stdin.write(BatchChecker.HANDSHAKE)
+                self.process.stdin.flush()
+                replies.append(self.process.stdout.readline().strip())
+            except OSError:
+                pass
+
+        # Reply is read from another thread, so a checker waiting for input cannot block the judge
+        reader = threading.Thread(target=read_reply, daemon=True)
+        reader.start()
+        reader.join(BATCH_HANDSHAKE_TIMEOUT)
+        if reader.is_alive():
+            self.process.kill()
+            reader.join()
+
+        return replies == [BatchChecker.HANDSHAKE_REPLY]
+
+    def check(self, input_filepath: str, user_output_filepath: str, expected_output_filepath: str):
+        '''
+        Send a test case to checker
+
+        Returns verdict of checker, or None if checker does not support batch mode
+        or did not reply with a verdict
+        '''
+        request = json.dumps({
+            'input': input_filepath,
+            'output': user_output_filepath,
+            'answer': expected_output_filepath
+        }) + '\n'
+
+        with self.lock:
+            if not self.supported:
+                return None
+
+            try:
+                self.process.stdin.write(request.encode())
+                self.process.stdin.flush()
+                reply = self.process.stdout.readline().strip()
+            except OSError:
+                reply = b''
+
+            # Checker breaking the protocol is run once per test case from now on
+            if reply not in (b'AC', b'WA'):
+                self.supported = False
+                self.close()
+                return None
+
+        return reply.decode()
+
+    def close(self):
+        """Stop checker process"""
+        try:
+            # Checker in batch mode is expected to exit once its input is closed
+            self.process.stdin.close()
+        except OSError:
+            pass
+        if self.process.poll() is None:
+            self.process.terminate()
+        self.process.wait()
+        self.process.stdout.close()
+
+
+# Check function of checker, loaded once by every process of the checker pool
+checker_function = None
+
+# Runs compiled checker (first argument) as __main__, with the __file__, sys.argv[0] and sys.path[0]
+# it would get if its source file (second argument) was run directly
+CHECKER_BOOTSTRAP = '''
+import importlib.util, marshal, os, sys, types
+compiled_filepath = sys.argv.pop(1)
+del sys.argv[0]
+checker_filepath = os.path.abspath(sys.argv[0])
+sys.path[0] = os.path.dirname(checker_filepath)
+with open(compiled_filepath, 'rb') as compiled_fileobj:
+    bytecode = compiled_fileobj.read()
+if bytecode[:4] != importlib.util.MAGIC_NUMBER:
+    import runpy
+    runpy.run_path(checker_filepath, run_name='__main__')
+else:
+    checker_module = types.ModuleType('__main__')
+    checker_module.__file__ = checker_filepath
+    sys.modules['__main__'] = checker_module
+    exec(marshal.loads(bytecode[16:]), checker_module.__dict__)
+'''
+
+
+def is_compiled_checker_current(compiled_filepath: str, checker_filepath: str) -> bool:
+    '''
+    Determine whether compiled checker was compiled from the current checker by this interpreter,
+    comparing modification time and size of checker with the ones recorded in bytecode header
+    '''
+    try:
+        with open(compiled_filepath, 'rb') as compiled_fileobj:
+            header = compiled_fileobj.read(16)
+        checker_stat = os.stat(checker_filepath)
+    except OSError:
+        return False
+
+    # Header holds magic number, flags (0 for timestamp-based bytecode), source mtime and size
+    return len(header) == 16 and header[:4] == importlib.util.MAGIC_NUMBER \
+        and int.from_bytes(header[4:8], 'little') == 0 \
+        and int.from_bytes(header[8:12], 'little') == int(checker_stat.st_mtime) & 0xFFFFFFFF \
+        and int.from_bytes(header[12:16], 'little') == checker_stat.st_size & 0xFFFFFFFF
+
+
+def compile_checker(checker_filepath: str) -> str:
+    '''
+    Compile checker into bytecode inside cache directory, unless bytecode is current
+    (refer to is_compiled_checker_current)
+
+    Returns path of compiled checker, or None if checker failed to compile
+    '''
+    # Checkers with the same name in different directories, or compiled by different
+    # interpreters, are compiled separately
+    path_digest = hashlib.blake2b(checker_filepath.encode(), digest_size=8).hexdigest()
+    compiled_filepath = os.path.join(
+        CACHE_ROOT,
+        f'{os.path.basename(checker_filepath)}.{path_digest}.{sys.implementation.cache_tag}.pyc')
+    if is_compiled_checker_current(compiled_filepath, checker_filepath):
+        # Modification time of compiled checker marks when it was last used
+        os.utime(compiled_filepath)
+        return compiled_filepath
+
+    try:
+        # Ask for timestamp-based bytecode, which SOURCE_DATE_EPOCH would switch to hash-based
+        py_compile.compile(checker_filepath, cfile=compiled_filepath, doraise=True,
+                           invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP)
+    except py_compile.PyCompileError:
+        # Checker is run from source, so its error is reported when it runs
+        return None
+
+    prune_build_cache()
+    return compiled_filepath
+
+
+def is_main_guard(node: ast.stmt) -> bool:
+    """Determine whether a statement is an if __name__ == '__main__' block"""
+    return isinstance(node, ast.If) and isinstance(node.test, ast.Compare) \
+        and isinstance(node.test.left, ast.Name) and node.test.left.id == '__name__'
+
+
+def is_check_function(node: ast.stmt) -> bool:
+    """Determine whether a statement defines check(input, output, answer) with three arguments"""
+    if not (isinstance(node, ast.FunctionDef) and node.name == 'check'):
+        return False
+
+    arguments = node.args
+    required_keyword_arguments = [default for default in arguments.kw_defaults if default is None]
+    return len(getattr(arguments, 'posonlyargs', [])) + len(arguments.args) == 3 \
+        and not arguments.defaults and arguments.vararg is None and not required_keyword_arguments
+
+
+def defines_check_function(checker_filepath: str) -> bool:
+    '''
+    Determine whether checker defines a check(input, output, answer) function and can be imported,
+    without running it
+
+    Checker can only be imported if everything besides definitions and imports is
+    inside an if __name__ == '__main__' block
+    '''
+    try:
+        with open(checker_filepath, 'rb') as checker_fileobj:
+            tree = ast.parse(checker_fileobj.read(), checker_filepath)
+    except SyntaxError:
+        return False
+
+    importable_statements = (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.ClassDef,
+                             ast.Assign, ast.AnnAssign)
+    for node in tree.body:
+        is_docstring = isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+        if not (isinstance(node, importable_statements) or is_docstring or is_main_guard(node)):
+            return False
+
+    # Last definition named check is the one kept by the module
+    check_definitions = [node for node in tree.body
+                         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+                         and node.name == 'check']
+    return bool(check_definitions) and is_check_function(check_definitions[-1])
+
+
+def load_checker_function(checker_filepath: str):
+    """Import checker and keep its check function (initializer of processes of the checker pool)"""
+    global checker_function
+    # Checker can import modules next to it, as when it is run directly
+    sys.path.insert(0, os.path.dirname(checker_filepath))
+    spec = importlib.util.spec_from_file_location('checker', checker_filepath)
+    checker_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(checker_module)
+    checker_function = checker_module.check
+
+
+def run_checker_function(input_filepath: str, user_output_filepath: str,
+                         expected_output_filepath: str) -> bool:
+    """Run check function of checker inside a process of the checker pool"""
+    return bool(checker_function(input_filepath, user_output_filepath, expected_output_filepath))
+
+
+class CheckerCompareCheckStrategy(CheckSolutionStrategy):
+    """A strategy of verifying solution using a checker"""
+
+    # Shared by every test case of a run, set up by evaluate_submission
+    batch_checker: BatchChecker = None
+    checker_pool: ProcessPoolExecutor = None
+    compiled_checker: str = None
+
+    @staticmethod
+    def setup_shared_checker(parsed_args: ArgumentConfig, tc_count: int):
+        '''
+        Start checker once for every test case of a run
+
+        With --check_function, checker is imported by a pool of processes (at most one per
+        test case), which take return value of its check(input, output, answer) as verdict.
+        Otherwise, checker is started in batch mode (refer to BatchChecker class)
+
+        '''
+        checker_filepath = os.path.join(CWD, parsed_args.checker_name)
+        if not os.path.isfile(checker_filepath):
+            raise CheckerNotFound()
+
+        # Return value of check is not an exit code, so it is only used when asked for
+        if parsed_args.check_function and not defines_check_function(checker_filepath):
+            raise InvalidStrategy(
+                "Checker must define check(input, output, answer) and only run other code "
+                "inside an if __name__ == '__main__' block")
+
+        # Bytecode of checker is run, so checker is not parsed again by every process running it
+        CheckerCompareCheckStrategy.compiled_checker = compile_checker(checker_filepath)
+
+        if parsed_args.check_function:
+            # Processes are spawned rather than forked from a process already running threads
+            CheckerCompareCheckStrategy.checker_pool = ProcessPoolExecutor(
+                max_workers=min(parsed_args.jobs, tc_count),
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=load_checker_function,
+                initargs=(checker_filepath,)
+            )
+        else:
+            CheckerCompareCheckStrategy.batch_checker = BatchChecker(
+                CheckerCompareCheckStrategy.get_checker_argv(parsed_args))
+
+    @staticmethod
+    def cleanup_shared_checker():
+        """Stop checker started by setup_shared_checker"""
+        if CheckerCompareCheckStrategy.checker_pool:
+            CheckerCompareCheckStrategy.checker_pool.shutdown()
+            CheckerCompareCheckStrategy.checker_pool = None
+        if CheckerCompareCheckStrategy.batch_checker:
+            CheckerCompareCheckStrategy.batch_checker.close()
+            CheckerCompareCheckStrategy.batch_checker = None
+
+    def __init__(self, parsed_args: ArgumentConfig, tc_dir: str):
+        super().__init__(parsed_args, tc_dir)
+        self.input_filepath = os.path.join(tc_dir, parsed_args.input_filename)
+
+    def setup_strategy(self):
+        checker_filepath = os.path.join(
+            CWD, self.parsed_args.checker_name)
+        if not os.path.isfile(checker_filepath):
+            raise CheckerNotFound()
+
+    @staticmethod
+    def evaluate_python_compiler() -> Literal['python', 'python3']:
+        '''Determine the appropriate python compiler based on operating system'''
+        return 'python' if (sys.platform == 'win32') else 'python3'
+
+    @staticmethod
+    def get_checker_argv(parsed_args: ArgumentConfig) -> List[str]:
+        """Returns argument list used to run checker, with the interpreter running the judge"""
+        python = sys.executable or CheckerCompareCheckStrategy.evaluate_python_compiler()
+        if not CheckerCompareCheckStrategy.compiled_checker:
+            return [python, '-u', parsed_args.checker_name]
+
+        # Compiled checker is run through a bootstrap, so it still sees the path of its source file
+        return [python, '-u', '-c', CHECKER_BOOTSTRAP,
+                CheckerCompareCheckStrategy.compiled_checker, parsed_args.checker_name]
+
+    def run_checker(self) -> int:
+        '''
+        Run checker with provided input file and output files
+
+        Returns exit code of checker
+        '''
+        checker_process = subprocess.Popen(
+            CheckerCompareCheckStrategy.get_checker_argv(self.parsed_args) + [
+                self.input_filepath,
+                self.user_output_filepath,
+                self.expected_output_filepath
+            ])
+
+        return checker_process.wait()
+
+    def check_output(self):
+        verdict = None
+        if CheckerCompareCheckStrategy.checker_pool:
+            try:
+                verdict = 'AC' if CheckerCompareCheckStrategy.checker_pool.submit(
+                    run_checker_function,
+                    self.input_filepath,
+                    self.user_output_filepath,
+                    self.expected_output_filepath
+                ).result() else 'WA'
+            except Exception:
+                # Checker could not be imported or its check function failed, so the
+                # checker is run on its own to decide, as it would be without the pool
+                pass
+        elif CheckerCompareCheckStrategy.batch_checker:
+            verdict = CheckerCompareCheckStrategy.batch_checker.check(
+                self.input_filepath, self.user_output_filepath, self.expected_output_filepath)
+
+        if verdict is None:
+            checker_exit_code = self.run_checker()
+            verdict = 'AC' if (checker_exit_code == 0) else 'WA'
+        self.cleanup()
+        return verdict
+
+    def cleanup(self):
+        os.remove(self.user_output_filepath)
+
+
+def check_tc(
+    execute_argv: List[str],
+    input_strategy: InputStrategy,
+    check_strategy: CheckSolutionStrategy,
+    output_cache: OutputCache = None
+):
+    '''
+    Run user's code against provided a test case
+
+    Returns whether the test case passed and the message explaining its verdict (if any)
+
+    Parameters:
+    execute_argv (list[str]): Argument list used to execute file generated from
+    compilation of submission file
+    input_strategy (InputStrategy): Input strategy that is used for this source code
+    check_strategy (CheckSolutionStrategy): Strategy used by source code to verify correctness
+    output_cache (OutputCache): Cache used to skip running inputs that were already run (optional)
+
+    '''
+    if check_strategy.streams_output:
+        # Output is compared while source code is running
+        check_strategy.process = input_strategy.stream_strategy(execute_argv)
+    elif output_cache is None:
+        input_strategy.execute_strategy(execute_argv)
+    else:
+        input_digest = OutputCache.hash_input(input_strategy.input_filepath)
+        if not output_cache.restore(input_digest, input_strategy.user_output_filepath):
+            input_strategy.execute_strategy(execute_argv)
+            output_cache.store(
+                input_digest, input_strategy.user_output_filepath)
+
+    # Get verdict by checking user output against expected output
+    passed = check_strategy.check_output() == "AC"
+
+    return passed, check_strategy.message
+
+
+def run_compile_command(compiling_strategy: CompilingStrategy):
+    """Run compile command of user submission, raising CompilationError if it fails"""
+    try:
+        exit_code = subprocess.call(
+            compiling_strategy.get_compile_command(), cwd=CWD)
+    except FileNotFoundError:
+        # Compiler is not installed
+        exit_code = -1
+
+    if exit_code != 0:
+        raise CompilationError(compiling_strategy.filename_with_extension)
+
+
+def get_source_id(source_filepath: str) -> str:
+    """Returns inode, modification time and size of a source code file, identifying its content"""
+    source_stat = os.stat(source_filepath)
+    return f'{source_stat.st_ino} {source_stat.st_mtime_ns} {source_stat.st_size}'
+
+
+def get_last_build_key(record_filepath: str, source_id: str, compile_command: str):
+    '''
+    Look up the cache key of the last successful build of a source code file
+
+    Returns the key if source code file is the same as in that build (refer to get_source_id)
+    and was compiled with the same command, None otherwise
+
+    Parameters:
+    record_filepath (str): path of the file recording the last build
+    source_id (str): identity of the source code file, as returned by get_source_id
+    compile_command (str): command used to compile source code
+
+    '''
+    try:
+        with open(record_filepath, 'r', encoding='utf-8') as record_fileobj:
+            key, recorded_source_id, recorded_command = record_fileobj.read().split('\n', 2)
+    except (OSError, ValueError):
+        return None
+
+    if recorded_source_id != source_id or recorded_command != compile_command:
+        return None
+    return key
+
+
+def compile_submission(compiling_strategy: CompilingStrategy, use_cache: bool):
+    '''
+    Compile user submission
+
+    When caching is enabled, artifacts are built into a cache directory keyed on
+    the content of the source code file and the compile command, and compilation
+    is skipped if that key was already built successfully. Source code file with the same
+    inode, modification time and size as in the last build is not even read to compute the key
+    Otherwise, artifacts are built into a temporary directory removed on cleanup
+
+    Parameters:
+    compiling_strategy (CompilingStrategy): Compiling strategy used by source code
+    use_cache (bool): whether compiled artifacts should be cached
+
+    '''
+    if not use_cache:
+        compiling_strategy.use_temporary_build_dir()
+        run_compile_command(compiling_strategy)
+        return
+
+    source_filepath = compiling_strategy.filename_with_extension
+    compile_command = shlex.join(compiling_strategy.get_compile_command())
+    # Source code files with the same name in different directories are recorded separately
+    path_digest = hashlib.blake2b(
+        os.path.abspath(source_filepath).encode(), digest_size=8).hexdigest()
+    record_filepath = os.path.join(
+        CACHE_ROOT, f'{os.path.basename(source_filepath)}.{path_digest}.last')
+
+    # Source code file is identified before it is read, so edits made meanwhile show up next run
+    source_id = get_source_id(source_filepath)
+    key = get_last_build_key(record_filepath, source_id, compile_command)
+    if key is None:
+        with open(source_filepath, 'rb') as source_fileobj:
+            source = source_fileobj.read()
+        key = hashlib.blake2b(
+            source + compile_command.encode(), digest_size=16).hexdigest()
+
+    stamp_filepath = os.path.join(CACHE_ROOT, f'{key}.stamp')
+    compiling_strategy.build_dir = os.path.join(CACHE_ROOT, key)
+
+    # Artifacts are checked as well, in case they were removed from the cache directory
+    if not os.path.isfile(stamp_filepath) or \
+            not all(os.path.isfile(artifact) for artifact in compiling_strategy.get_artifacts()):
+        os.makedirs(compiling_strategy.build_dir, exist_ok=True)
+        try:
+            run_compile_command(compiling_strategy)
+        except CompilationError:
+            # Failed builds are not kept, as nothing would ever prune them
+            shutil.rmtree(compiling_strategy.build_dir, ignore_errors=True)
+            raise
+
+        # Only remember successful builds
+        with open(stamp_filepath, 'w', encoding='utf-8'):
+            pass
+    else:
+        # Modification time of stamp marks when build was last used
+        os.utime(stamp_filepath)
+
+    with open(record_filepath, 'w', encoding='utf-8') as record_fileobj:
+        record_fileobj.write(f'{key}\n{source_id}\n{compile_command}')
+
+    prune_build_cache()
+
+
+def prune_build_cache():
+    '''
+    Remove least recently used builds from cache directory, once more than MAX_CACHED_BUILDS
+    are stored, along with last build records pointing to a removed build
+
+    Least recently used compiled checkers are removed as well, once more than
+    MAX_CACHED_CHECKERS are stored
+    '''
+    with os.scandir(CACHE_ROOT) as entries:
+        cached_files = [entry for entry in entries if entry.is_file()]
+    stamps = sorted((entry for entry in cached_files if entry.name.endswith('.stamp')),
+                    key=lambda entry: entry.stat().st_mtime_ns)
+    compiled_checkers = sorted((entry for entry in cached_files if entry.name.endswith('.pyc')),
+                               key=lambda entry: entry.stat().st_mtime_ns)
+
+    # Files may also be removed meanwhile by another run pruning the same cache directory
+    for stamp in stamps[:max(0, len(stamps) - MAX_CACHED_BUILDS)]:
+        key = stamp.name[:-len('.stamp')]
+        # Stamp is removed first, so a partially removed build is never reused
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(stamp.path)
+        shutil.rmtree(os.path.join(CACHE_ROOT, key), ignore_errors=True)
+
+    for record in (entry for entry in cached_files if entry.name.endswith('.last')):
+        with contextlib.suppress(FileNotFoundError):
+            with open(record.path, encoding='utf-8') as record_fileobj:
+                key = record_fileobj.readline().rstrip('\n')
+            if not os.path.isfile(os.path.join(CACHE_ROOT, f'{key}.stamp')):
+                os.remove(record.path)
+
+    for compiled_checker in compiled_checkers[:max(0, len(compiled_checkers) -
+                                                    MAX_CACHED_CHECKERS)]:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(compiled_checker.path)
+
+
+def index_test_cases(parsed_args: ArgumentConfig) -> List[Tuple[str, str]]:
+    '''
+    Walk test case directory once and validate every test case in it
+
+    Returns (name, directory) of every test case, sorted by name
+    Raises TCNotFound if a test case does not contain both input and expected output file
+
+    '''
+    with os.scandir(TC_ROOT) as entries:
+        tc_entries = sorted(
+            (entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+
+    required_filenames = {parsed_args.input_filename,
+                          parsed_args.output_filename}
+    test_cases = []
+    for entry in tc_entries:
+        # File type of each entry comes from the directory listing, so no stat is needed
+        with os.scandir(entry.path) as tc_files:
+            filenames = {tc_file.name for tc_file in tc_files if tc_file.is_file()}
+
+        if not required_filenames <= filenames:
+            raise TCNotFound(entry.name)
+
+        test_cases.append((entry.name, entry.path))
+
+    return test_cases
+
+
+def judge_tc(
+    parsed_args: ArgumentConfig,
+    strategy_classes: Tuple[type, type],
+    execute_argv: List[str],
+    tc_dir: str,
+    output_cache: OutputCache = None
+):
+    '''
+    Build the strategies for a single test case and run user's code against it
+
+    Parameters:
+    strategy_classes (tuple[type, type]): input strategy class and check solution strategy class
+    execute_argv (list[str]): Argument list used to execute file generated from
+    compilation of submission file
+    tc_dir (str): directory of the test case
+    output_cache (OutputCache): Cache used to skip running inputs that were already run (optional)
+
+    '''
+    input_strategy_class, check_strategy_class = strategy_classes
+    return check_tc(
+        execute_argv,
+        input_strategy_class(parsed_args, tc_dir),
+        check_strategy_class(parsed_args, tc_dir),
+        output_cache
+    )
+
+
+def judge_batch(
+    parsed_args: ArgumentConfig,
+    strategy_classes: Tuple[type, type],
+    execute_argv: List[str],
+    tc_dirs: List[str],
+    output_cache: OutputCache = None
+):
+    '''
+    Run user's code against a batch of test cases
+
+    Returns whether each test case passed, along with its message (if any)
+
+    When batching is disabled, each test case of the batch is run on its own
+
+    Parameters:
+    strategy_classes (tuple[type, type]): input strategy class and check solution strategy class
+    execute_argv (list[str]): Argument list used to execute file generated from
+    compilation of submission file
+    tc_dirs (list[str]): directories of the test cases in this batch
+    output_cache (OutputCache): Cache used to skip running inputs that were already run (optional)
+
+    '''
+    if parsed_args.batch == 1:
+        return [judge_tc(parsed_args, strategy_classes, execute_argv, tc_dir, output_cache)
+                for tc_dir in tc_dirs]
+
+    check_strategy_class = strategy_classes[1]
+    check_strategies = [check_strategy_class(parsed_args, tc_dir) for tc_dir in tc_dirs]
+    BatchedInputStrategy(parsed_args, tc_dirs).execute_strategy(execute_argv)
+
+    results = []
+    for check_strategy in check_strategies:
+        passed = check_strategy.check_output() == "AC"
+        results.append((passed, check_strategy.message))
+
+    return results
+
+
+def evaluate_submission(parsed_args: ArgumentConfig, compiling_strategy: CompilingStrategy):
+    '''
+    Evaluate provided submission file by running it against provided test cases
+
+    Parameters:
+    compiling_strategy (CompilingStrategy): Compiling strategy used by source code
+
+    '''
+    if parsed_args.jobs < 1:
+        raise InvalidStrategy("Number of jobs must be a positive integer")
+
+    batch_size = parsed_args.batch
+    if batch_size < 1:
+        raise InvalidStrategy("Batch size must be a positive integer")
+    if batch_size > 1 and parsed_args.input_strat != 'automatic':
+        raise InvalidStrategy(
+            "Batching is only supported by automatic input strategy")
+    if batch_size > 1 and parsed_args.check_strat == 'stream':
+        raise InvalidStrategy(
+            "Batching is not supported by stream check strategy")
+    if parsed_args.input_strat == 'persistent' and parsed_args.check_strat == 'stream':
+        raise InvalidStrategy(
+            "Persistent input strategy is not supported by stream check strategy")
+    if parsed_args.dedup_inputs and (batch_size > 1 or parsed_args.check_strat == 'stream'):
+        raise InvalidStrategy(
+            "Deduplicating inputs is not supported together with batching or stream check strategy")
+    if parsed_args.check_function and parsed_args.check_strat != 'checker':
+        raise InvalidStrategy(
+            "Calling check function of checker is only supported by checker check strategy")
+
+    # Validate strategies and test cases before spending time on compilation
+    strategy_classes = (get_input_strategy_class(parsed_args),
+                        get_check_solution_strategy_class(parsed_args))
+    test_cases = index_test_cases(parsed_args)
+    if parsed_args.check_strat == 'checker' and \
+            not os.path.isfile(os.path.join(CWD, parsed_args.checker_name)):
+        raise CheckerNotFound()
+
+    verdict_cache = VerdictCache(
+        parsed_args, compiling_strategy) if parsed_args.cache_verdicts else None
+
+    # Artifacts, cached outputs and shared checker are cleaned up even if judging fails
+    with compiling_strategy, contextlib.ExitStack() as cleanup_stack:
+        # Compile user submission
+        compile_submission(compiling_strategy, parsed_args.cache)
+
+        # Test cases are run from this argument list directly, without spawning a shell
+        execute_argv = compiling_strategy.get_execute_command()
+
+        # Verdict of every test case is stored as one byte (1 if passed), messages only when given
+        verdicts = bytearray(len(test_cases))
+        messages = {}
+        output_cache = OutputCache() if parsed_args.dedup_inputs else None
+        if output_cache:
+            cleanup_stack.callback(output_cache.cleanup)
+
+        # Test cases cancelled by fail fast are left out of the verdict
+        skipped = set()
+
+        # Only run test cases whose verdict is not cached
+        pending = list(range(len(test_cases)))
+        if verdict_cache:
+            cache_keys = [verdict_cache.get_key(tc_dir) for _, tc_dir in test_cases]
+            pending = []
+            cached_failure = False
+            for idx, key in enumerate(cache_keys):
+                cached_verdict = verdict_cache.lookup(key)
+                if cached_verdict is None:
+                    pending.append(idx)
+                    continue
+                verdicts[idx], message = cached_verdict
+                cached_failure |= not verdicts[idx]
+                if message:
+                    messages[idx] = message
+
+            # Cached failure counts as the first failure, so no other test case is run
+            if cached_failure and parsed_args.fail_fast:
+                skipped.update(pending)
+                pending = []
+
+        # Start checker once for the whole run instead of once per test case
+        if parsed_args.check_strat == 'checker' and pending:
+            cleanup_stack.callback(CheckerCompareCheckStrategy.cleanup_shared_checker)
+            CheckerCompareCheckStrategy.setup_shared_checker(parsed_args, len(pending))
+
+        # Test cases are independent, so run batches of them concurrently and put
+        # each verdict back at the index of its test case
+        with ThreadPoolExecutor(max_workers=parsed_args.jobs) as executor:
+            futures = {}
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                future = executor.submit(
+                    judge_batch,
+                    parsed_args,
+                    strategy_classes,
+                    execute_argv,
+                    [test_cases[idx][1] for idx in batch],
+                    output_cache
+                )
+                futures[future] = batch
+
+            for future in as_completed(futures):
+                if future.cancelled():
+                    skipped.update(futures[future])
+                    continue
+
+                failed = False
+                for idx, (passed, message) in zip(futures[future], future.result()):
+                    verdicts[idx] = passed
+                    failed |= not passed
+                    if message:
+                        messages[idx] = message
+                    if verdict_cache:
+                        verdict_cache.store(cache_keys[idx], passed, message)
+
+                # Batches that already started still finish, the others are cancelled
+                if failed and parsed_args.fail_fast:
+                    for other_future in futures:
+                        other_future.cancel()
+
+        if verdict_cache:
+            verdict_cache.save()
+
+        # Print verdict of all judged test cases
+        judged = [idx for idx in range(len(test_cases)) if idx not in skipped]
+        print_verdict(
+            [test_cases[idx][0] for idx in judged],
+            bytearray(verdicts[idx] for idx in judged),
+            {pos: messages[idx] for pos, idx in enumerate(judged) if idx in messages}
+        )
+        if skipped:
+            print(f"{len(skipped)} test case(s) skipped after the first failure\n")
+
+
+def print_verdict(tc_names: List[str], verdicts: bytearray, messages: Dict[int, str]):
+    '''
+    Print test case verdict with appropriate format
+
+    Parameters:
+    tc_names(list[str]): names of test cases
+    verdicts(bytearray): verdict of each test case, 1 if it passed and 0 otherwise
+    messages(dict[int, str]): message explaining verdict, by index of test case
+
+    '''
+    # Verdict is written at once instead of flushing every line
+    lines = ['']
+    for idx, (directory, passed) in enumerate(zip(tc_names, verdicts)):
+        if not passed:
+            msg = f" x Test case {directory} failed"
+            if idx in messages:
+                msg += f" ({messages[idx]})"
+            lines.append(f"\033[91m{msg}\033[00m")
+        else:
+            msg = f"Test case {directory} passed"
+            lines.append(f"\033[92m{msg}\033[00m")
+    lines.append('\n')
+    sys.stdout.write('\n'.join(lines))
+    sys.stdout.flush()
+
+
+# Strategy classes by configuration value, built once instead of on every lookup
+COMPILING_STRATEGIES = {
+    '.cpp': CppCompilingStrategy,
+    '.java': JavaCompilingStrategy
+}
+
+INPUT_STRATEGIES = {
+    'automatic': AutomaticInputStrategy,
+    'manual': ManualInputStrategy,
+    'persistent': PersistentWorkerStrategy
+}
+
+CHECK_SOLUTION_STRATEGIES = {
+    'line': LineCompareCheckStrategy,
+    'checker': CheckerCompareCheckStrategy,
+    'stream': StreamingLineCompareCheckStrategy,
+    'tokens': TokensCheckStrategy
+}
+
+
+def get_compiling_strategy(filename_without_extension: str, extension: str) -> CompilingStrategy:
+    '''
+
+    Generate a compiling strategy based on extension of source code file
+
+    Parameters:
+    filename_without_extension: file name of the source code file without extension
+    extension: extension of the source code file
+
+    '''
+    if extension not in COMPILING_STRATEGIES:
+        raise InvalidSubmissionFile("Extension is not supported")
+
+    return COMPILING_STRATEGIES[extension](
+        filename_without_extension,
+        filename_without_extension + extension
+    )
+
+
+def get_input_strategy_class(parsed_args: ArgumentConfig) -> type:
+    '''
+
+    Determine input strategy class based on configuration
+    (resolved once per run, then instantiated for every test case)
+
+    '''
+    if parsed_args.input_strat not in INPUT_STRATEGIES:
+        raise InvalidStrategy(
+            f'Input strategy {parsed_args.input_strat} not supported')
+
+    return INPUT_STRATEGIES[parsed_args.input_strat]
+
+
+def get_check_solution_strategy_class(parsed_args: ArgumentConfig) -> type:
+    '''
+
+    Determine class of the strategy to verify solution based on configuration
+    (resolved once per run, then instantiated for every test case)
+
+    '''
+    if parsed_args.check_strat not in CHECK_SOLUTION_STRATEGIES:
+        raise InvalidStrategy("Check Solution Strategy not found")
+
+    return CHECK_SOLUTION_STRATEGIES[parsed_args.check_strat]
+
+
+def check_valid_file(filename: str):
+    '''
+    Check if submission file is a valid file
+    If file is valid, return filename (without extension) and extension as tuple of strings
+
+    Parameters:
+    filename(str): filename with extension of user source code
+    '''
+    # Extract file extension, which starts at the last dot
+    stem, ext = os.path.splitext(filename)
+
+    # If filename only contains extension (splitext keeps a leading dot in stem)
+    if not ext and stem.startswith('.'):
+        raise InvalidSubmissionFile("File name not found")
+
+    # If there is no extension
+    if not ext:
+        raise InvalidSubmissionFile("Extension not included")
+
+    # Check if file exists
+    filepath = os.path.join(CWD, filename)
+    if not os.path.isfile(filepath):
+        raise SubmissionFileNotFound(filename)
+
+    return stem, ext
+
+
+def cleanup_dir(dirname: str):
+    '''Clean up test_cases directory, leaving it empty'''
+    if os.path.isdir(dirname):
+        shutil.rmtree(dirname)
+    os.makedirs(dirname, exist_ok=True)
+
+
+def import_test_cases(parsed_args: ArgumentConfig) -> None:
+    '''
+    Import external test cases.
+    Every test case of the folder consists of a .in and a .ans file with the same name,
+    other files are ignored
+
+    Files are hard-linked into test case directory when possible, leaving the external folder intact
+    '''
+    ext_tc_dir = parsed_args.test_cases
+
+    if not ext_tc_dir:
+        return
+
+    if not os.path.isdir(ext_tc_dir):
+        raise TCNotFound(ext_tc_dir)
+
+    # Pair input and expected output files of every test case in a single pass
+    tc_files = {}
+    with os.scandir(ext_tc_dir) as entries:
+        for entry in entries:
+            tc_name, _, extension = entry.name.rpartition('.')
+            if tc_name and extension in ('in', 'ans') and entry.is_file():
+                tc_files.setdefault(tc_name, {})[extension] = entry.path
+
+    # Validate every test case before importing any of them
+    for tc_name, files in tc_files.items():
+        if len(files) != 2:
+            raise TCNotFound(os.path.join(ext_tc_dir, tc_name))
+
+    cleanup_dir(TC_DIR)
+    for tc_name, files in tc_files.items():
+        os.mkdir(f'{TC_DIR}/{tc_name}')
+        link_or_copy(files['in'],
+                     f'{TC_DIR}/{tc_name}/{parsed_args.input_filename}')
+        link_or_copy(files['ans'],
+                     f'{TC_DIR}/{tc_name}/{parsed_args.output_filename}')
+
+
+def parse_args():
+    '''
+    Parse CLI arguments
+
+    Parameters:
+        - args: argument list stored as string array
+
+    Returns:
+        ArgumentParser object containing parsed data
+    '''
+    arg_config = ArgumentConfig()
+
+    parser = argparse.ArgumentParser(
+        description="Mini Judge to test your solution against pre-generated test cases",
+    )
+
+    parser.add_argument(
+        '-f', '--filename', help="Name of solution file", action='store')
+    parser.add_argument('-tc', '--test_cases',
+                        help="Location of test case", action="store")
+    parser.add_argument(
+        '-is', '--input_strat', help="Input strategy (automatic | manual | persistent)", action='store'
+    )
+    parser.add_argument(
+        '-cs', '--check_strat', help="Check strategy (line | checker | stream | tokens)", action='store'
+    )
+    parser.add_argument(
+        '-cn', '--checker_name', help="Name of checker file", action="store"
+    )
+    parser.add_argument(
+        '-cf', '--check_function',
+        help="Import checker and use return value of its check(input, output, answer) as verdict",
+        action="store_true"
+    )
+    parser.add_argument(
+        '-in', '--input_filename', help="Input filename", action="store"
+    )
+    parser.add_argument(
+        '-out', '--output_filename', help="Expected output filename", action="store"
+    )
+    parser.add_argument(
+        '-j', '--jobs', help="Number of test cases to run concurrently", action="store", type=int
+    )
+    parser.add_argument(
+        '-b', '--batch', help="Number of test cases to feed into a single run of the solution",
+        action="store", type=int
+    )
+    parser.add_argument(
+        '-nc', '--no_cache', dest='cache', help="Always recompile the solution",
+        action="store_false"
+    )
+    parser.add_argument(
+        '-di', '--dedup_inputs', help="Run the solution only once for identical inputs",
+        action="store_true"
+    )
+    parser.add_argument(
+        '-cv', '--cache_verdicts', help="Skip test cases already judged for the same solution",
+        action="store_true"
+    )
+    parser.add_argument(
+        '-ff', '--fail_fast', help="Stop running test cases after the first failed one",
+        action="store_true"
+    )
+
+    parser.parse_args(namespace=arg_config)
+
+    return arg_config
+
+
+def get_filename(parsed_args: ArgumentConfig):
+    '''
+    Determine submission filename.
+
+    If filename is not provided as CLI argument, it will be prompted.
+
+    Parameters:
+        - parsed_args: object containing parsed argument configurations
+    '''
+    if not parsed_args.filename:
+        print("Enter filename: ", end='')
+        input_file = input()
+        return input_file
+
+    return parsed_args.filename
+
+
+def main():
+    """Driver code"""
+
+    # Parse arguments
+    parsed_args = parse_args()
+
+    # Import external test cases
+    import_test_cases(parsed_args)
+
+    # Prompt for submission's filename
+    input_file = get_filename(parsed_args)
+
+    filename_without_extension, extension = check_valid_file(input_file)
+
+    # Generate compiling strategy for source code
+    compiling_strategy = get_compiling_strategy(
+        filename_without_extension, extension)
+
+    # Evaluate source code
+    evaluate_submission(parsed_args, compiling_strategy)
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except CustomException as err:
+        print(f"\033[91m{err.msg}\033[00m")
+        sys.exit(1)
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cmd_script  # noqa: E402
+
+
+class PruneBuildCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache_root = tmp_dir.name
+        cache_patch = mock.patch.object(cmd_script, 'CACHE_ROOT', self.cache_root)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def write_cached_file(self, filename: str, content: str = '', last_used: int = 0) -> str:
+        filepath = os.path.join(self.cache_root, filename)
+        with open(filepath, 'w', encoding='utf-8') as fileobj:
+            fileobj.write(content)
+        os.utime(filepath, (last_used, last_used))
+        return filepath
+
+    def test_prune_builds_with_their_records(self):
+        for last_used in range(cmd_script.MAX_CACHED_BUILDS + 1):
+            os.mkdir(os.path.join(self.cache_root, f'key{last_used}'))
+            self.write_cached_file(f'key{last_used}.stamp', last_used=last_used)
+        evicted_record = self.write_cached_file('old.cpp.0.last', 'key0\n1 2 3\ng++ old.cpp')
+        kept_record = self.write_cached_file('new.cpp.0.last', 'key1\n1 2 3\ng++ new.cpp')
+
+        cmd_script.prune_build_cache()
+
+        self.assertFalse(os.path.exists(os.path.join(self.cache_root, 'key0')))
+        self.assertFalse(os.path.exists(os.path.join(self.cache_root, 'key0.stamp')))
+        self.assertTrue(os.path.isdir(os.path.join(self.cache_root, 'key1')))
+        self.assertFalse(os.path.exists(evicted_record))
+        self.assertTrue(os.path.exists(kept_record))
+
+    def test_prune_compiled_checkers(self):
+        compiled_checkers = [self.write_cached_file(f'checker{last_used}.py.0.tag.pyc',
+                                                    last_used=last_used)
+                             for last_used in range(cmd_script.MAX_CACHED_CHECKERS + 1)]
+
+        cmd_script.prune_build_cache()
+
+        self.assertFalse(os.path.exists(compiled_checkers[0]))
+        self.assertTrue(all(os.path.exists(filepath) for filepath in compiled_checkers[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cmd_script  # noqa: E402
+
+
+# Exit code checker that happens to define a check function returning its exit code
+EXIT_CODE_CHECKER = textwrap.dedent('''
+    import sys
+
+
+    def check(input_filepath, output_filepath, answer_filepath):
+        with open(output_filepath) as output_fileobj, open(answer_filepath) as answer_fileobj:
+            return 0 if output_fileobj.read().split() == answer_fileobj.read().split() else 1
+
+
+    if __name__ == '__main__':
+        sys.exit(check(*sys.argv[1:4]))
+''')
+
+# Checker following the check function protocol, returning whether output is correct
+CHECK_FUNCTION_CHECKER = textwrap.dedent('''
+    def check(input_filepath, output_filepath, answer_filepath):
+        with open(output_filepath) as output_fileobj, open(answer_filepath) as answer_fileobj:
+            return output_fileobj.read().split() == answer_fileobj.read().split()
+''')
+
+# One-shot checker printing WA when it cannot read its arguments, as it does when started in batch mode
+ONE_SHOT_CHECKER = textwrap.dedent('''
+    import sys
+
+    try:
+        with open(sys.argv[2]) as output_fileobj, open(sys.argv[3]) as answer_fileobj:
+            correct = output_fileobj.read().split() == answer_fileobj.read().split()
+    except Exception:
+        print('WA')
+        sys.exit(1)
+
+    print('AC' if correct else 'WA')
+    sys.exit(0 if correct else 1)
+''')
+
+# Checker supporting batch mode
+BATCH_CHECKER = textwrap.dedent('''
+    import json
+    import sys
+
+
+    def check(input_filepath, output_filepath, answer_filepath):
+        with open(output_filepath) as output_fileobj, open(answer_filepath) as answer_fileobj:
+            return output_fileobj.read().split() == answer_fileobj.read().split()
+
+
+    if sys.argv[1:] == ['--batch']:
+        for line in sys.stdin:
+            if line.strip() == 'BATCH':
+                print('BATCH 1', flush=True)
+                continue
+            request = json.loads(line)
+            print('AC' if check(request['input'], request['output'], request['answer']) else 'WA',
+                  flush=True)
+    else:
+        sys.exit(0 if check(*sys.argv[1:4]) else 1)
+''')
+
+# One-shot checker waiting for input it never gets when started in batch mode
+WAITING_CHECKER = textwrap.dedent('''
+    import sys
+
+    if sys.argv[1:] == ['--batch']:
+        sys.stdin.read()
+    sys.exit(0 if open(sys.argv[2]).read().split() == open(sys.argv[3]).read().split() else 1)
+''')
+
+
+class CheckerCompareCheckStrategyTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        cache_patch = mock.patch.object(
+            cmd_script, 'CACHE_ROOT', os.path.join(self.tmp_dir.name, cmd_script.CACHE_DIR))
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        self.addCleanup(cmd_script.CheckerCompareCheckStrategy.cleanup_shared_checker)
+
+    def write_file(self, filepath: str, content: str):
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as fileobj:
+            fileobj.write(content)
+
+    def judge(self, checker_source: str, user_outputs: dict, check_function: bool = False,
+              checker_mtime: float = None) -> dict:
+        """Returns verdict of every test case, judged with the given checker"""
+        parsed_args = cmd_script.ArgumentConfig()
+        parsed_args.check_strat = 'checker'
+        parsed_args.checker_name = os.path.join(self.tmp_dir.name, 'checker.py')
+        parsed_args.check_function = check_function
+        parsed_args.jobs = 1
+        self.write_file(parsed_args.checker_name, checker_source)
+        if checker_mtime is not None:
+            os.utime(parsed_args.checker_name, (checker_mtime, checker_mtime))
+
+        tc_dirs = {}
+        for tc_name, user_output in user_outputs.items():
+            tc_dir = tc_dirs[tc_name] = os.path.join(self.tmp_dir.name, tc_name)
+            self.write_file(os.path.join(tc_dir, parsed_args.input_filename), '1 2\n')
+            self.write_file(os.path.join(tc_dir, parsed_args.output_filename), '3\n')
+            self.write_file(os.path.join(tc_dir, cmd_script.USER_OUTPUT_FILENAME), user_output)
+
+        cmd_script.CheckerCompareCheckStrategy.setup_shared_checker(parsed_args, len(tc_dirs))
+        return {tc_name: cmd_script.CheckerCompareCheckStrategy(parsed_args, tc_dir).check_output()
+                for tc_name, tc_dir in tc_dirs.items()}
+
+    def test_exit_code_checker_defining_check(self):
+        verdicts = self.judge(EXIT_CODE_CHECKER, {'t1': '3\n', 't2': '4\n'})
+        self.assertEqual(verdicts, {'t1': 'AC', 't2': 'WA'})
+        self.assertIsNone(cmd_script.CheckerCompareCheckStrategy.checker_pool)
+
+    def test_check_function_is_opt_in(self):
+        verdicts = self.judge(CHECK_FUNCTION_CHECKER, {'t1': '3\n', 't2': '4\n'}, check_function=True)
+        self.assertEqual(verdicts, {'t1': 'AC', 't2': 'WA'})
+        self.assertIsNotNone(cmd_script.CheckerCompareCheckStrategy.checker_pool)
+
+    def test_compiled_checker_replaced_by_older_checker(self):
+        self.assertEqual(self.judge(ONE_SHOT_CHECKER, {'t1': '4\n'}), {'t1': 'WA'})
+        cmd_script.CheckerCompareCheckStrategy.cleanup_shared_checker()
+
+        # Checker accepting every output is restored with an older modification time
+        checker_mtime = os.stat(os.path.join(self.tmp_dir.name, 'checker.py')).st_mtime - 60
+        verdicts = self.judge('import sys\nsys.exit(0)\n', {'t1': '4\n'}, checker_mtime=checker_mtime)
+        self.assertEqual(verdicts, {'t1': 'AC'})
+
+    def test_one_shot_checker_printing_verdict(self):
+        verdicts = self.judge(ONE_SHOT_CHECKER, {'t1': '3\n', 't2': '4\n'})
+        self.assertEqual(verdicts, {'t1': 'AC', 't2': 'WA'})
+        self.assertFalse(cmd_script.CheckerCompareCheckStrategy.batch_checker.supported)
+
+    def test_batch_checker(self):
+        verdicts = self.judge(BATCH_CHECKER, {'t1': '3\n', 't2': '4\n', 't3': '3\n'})
+        self.assertEqual(verdicts, {'t1': 'AC', 't2': 'WA', 't3': 'AC'})
+        self.assertTrue(cmd_script.CheckerCompareCheckStrategy.batch_checker.supported)
+
+    def test_checker_not_replying_to_handshake(self):
+        with mock.patch.object(cmd_script, 'BATCH_HANDSHAKE_TIMEOUT', 0.5):
+            verdicts = self.judge(WAITING_CHECKER, {'t1': '3\n', 't2': '4\n'})
+        self.assertEqual(verdicts, {'t1': 'AC', 't2': 'WA'})
+        self.assertFalse(cmd_script.CheckerCompareCheckStrategy.batch_checker.supported)
+
+
+if __name__ == '__main__':
+    unittest.main()
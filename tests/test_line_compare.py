@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cmd_script  # noqa: E402
+
+
+class LineCompareCheckStrategyTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def judge(self, user_output: bytes, expected_output: bytes) -> tuple:
+        """Returns verdict and message of user output, judged line by line"""
+        parsed_args = cmd_script.ArgumentConfig()
+        for filename, content in ((cmd_script.USER_OUTPUT_FILENAME, user_output),
+                                  (parsed_args.output_filename, expected_output)):
+            with open(os.path.join(self.tmp_dir.name, filename), 'wb') as fileobj:
+                fileobj.write(content)
+
+        check_strategy = cmd_script.LineCompareCheckStrategy(parsed_args, self.tmp_dir.name)
+        return check_strategy.check_output(), check_strategy.message
+
+    def judge_huge(self, user_output: bytes, expected_output: bytes) -> tuple:
+        """Returns verdict and message of user output, judged as if both outputs were huge"""
+        with mock.patch.object(cmd_script, 'SPLIT_LINES_SIZE_LIMIT', 0), \
+                mock.patch.object(cmd_script, 'READ_BUFFER_SIZE', 4):
+            return self.judge(user_output, expected_output)
+
+    def test_huge_outputs_split_on_every_line_break(self):
+        expected_output = b'1 2\n3 4\n5 6\n7 8\n'
+        for user_output in (b'1 2\r3 4\r5 6\r7 8\r', b'1 2\r\n3 4\r5 6\n7 8',
+                            b'1 2\n3 4\n5 6\n7 8\n\n'):
+            self.assertEqual(self.judge_huge(user_output, expected_output), ('AC', None))
+
+    def test_huge_outputs_report_first_different_line(self):
+        expected_output = b'1 2\r\n3 4\r\n5 6\r\n7 8\r\n'
+        for user_output in (b'1 2\r3 4\r5 6\r7 9\r', b'1 2\n3 4\n5 6\n',
+                            b'1 2\r\r3 4\r\n5 6\r\n7 8\r\n'):
+            self.assertEqual(self.judge_huge(user_output, expected_output),
+                             self.judge(user_output, expected_output))
+            self.assertEqual(self.judge_huge(user_output, expected_output)[0], 'WA')
+
+
+if __name__ == '__main__':
+    unittest.main()